@@ -0,0 +1,81 @@
+"""Serves the dialogs of one adaptor to any number of threads.
+
+A UI shows a single dialog at a time and the subprocess backends talk to their
+child over a single pipe. When several threads ask for a dialog at once, they
+queue here and are served one by one, the highest priority first (then in the
+order of arrival).
+"""
+import heapq
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import count
+from typing import Callable
+
+
+class DialogScheduler:
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue: list[tuple[int, int, int]] = []
+        """ Heap of the waiting requests: (-priority, arrival order, thread ident). """
+        self._order = count()
+        self._owner: int | None = None
+        """ The thread whose dialog is being shown. """
+        self._depth = 0
+        """ Nesting of the owner's turns (a button callback may open an alert inside a dialog). """
+        self._guest: int | None = None
+        """ A thread working for the owner, see share(). """
+
+    @contextmanager
+    def turn(self, priority: int = 0):
+        """Wait until the calling thread may show its dialog. Re-entrant."""
+        me = threading.get_ident()
+        with self._cond:
+            if me in (self._owner, self._guest):
+                self._depth += 1
+            else:
+                entry = (-priority, next(self._order), me)
+                heapq.heappush(self._queue, entry)
+                self._cond.wait_for(lambda: self._owner is None and self._queue[0] is entry)
+                heapq.heappop(self._queue)
+                self._owner, self._depth = me, 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._depth -= 1
+                if not self._depth:
+                    self._owner = None
+                    self._cond.notify_all()
+
+    @contextmanager
+    def share(self):
+        """Let the calling thread act within the owner's turn.
+
+        For an owner handing its dialog over to another thread (an event loop)
+        and waiting for it, so the dialogs this thread opens meanwhile do not queue
+        behind the owner."""
+        with self._cond:
+            previous, self._guest = self._guest, threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._guest = previous
+
+    def submit(self, fn: Callable, /, *args, priority: int = 0, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) to be run in its turn, in a new thread. Returns at once."""
+        future = Future()
+
+        def run():
+            with self.turn(priority):
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
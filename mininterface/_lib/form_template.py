@@ -0,0 +1,79 @@
+from dataclasses import is_dataclass
+from typing import TYPE_CHECKING, Generic, Optional, Type, TypeVar
+
+from ..exceptions import DependencyRequired
+from ..tag.tag import Tag
+from .form_dict import FormDict, TagDict, dataclass_to_tagdict, dict_to_tagdict, tagdict_resolve
+from .form_types import DataClass
+
+if TYPE_CHECKING:
+    from .._mininterface import Mininterface
+    from .._mininterface.adaptor import BackendAdaptor
+
+FormT = TypeVar("FormT", FormDict, DataClass)
+
+
+class FormTemplate(Generic[FormT]):
+    """A form prepared once to be shown many times, see [`Mininterface.template`][mininterface.Mininterface.template]."""
+
+    def __init__(self, interface: "Mininterface", form: FormDict | DataClass | Type[DataClass],
+                 title: str = "", submit: str | bool = True):
+        self._interface = interface
+        self.title = title
+        self.submit = submit
+        self._dataclass: Optional[DataClass] = None
+        if isinstance(form, dict):
+            self._tagdict: TagDict = dict_to_tagdict(form, interface)
+        else:
+            if isinstance(form, type):  # a class, not an instance
+                try:
+                    from .cli_parser import parse_cli
+                except DependencyRequired as e:
+                    parse_cli = e
+                form, _ = parse_cli(form, {}, interface, args=[])
+            if not is_dataclass(form):
+                raise ValueError(f"Unknown form input {form}")
+            self._dataclass = form
+            self._tagdict = dataclass_to_tagdict(form, interface)
+
+    def show(self, values: Optional[dict] = None, title: Optional[str] = None) -> FormT:
+        """Fill the values in and prompt the user. Returns what [`form`][mininterface.Mininterface.form] would.
+
+        Args:
+            values: New values of some fields, in a dict shaped like the form.
+                (For a dataclass, by the field names, a nested dataclass in a nested dict.)
+                The other fields keep their values.
+            title: Change the form title.
+        """
+        if values:
+            _fill(self._tagdict, values)
+        if title is not None:
+            self.title = title
+        # Through the interface form method, an interface may wrap it.
+        return self._interface.form(self, self.title, submit=self.submit)  # type: ignore[arg-type]
+
+    def _run(self, adaptor: "BackendAdaptor", title: str, submit: str | bool) -> FormT:
+        """The dialog itself, see Mininterface._form."""
+        if self._dataclass is None:
+            return tagdict_resolve(adaptor.run_dialog(self._tagdict, title=title, submit=submit), extract_main=True)
+        if self._tagdict != {"": {}}:  # empty class
+            adaptor.run_dialog(self._tagdict, title=title, submit=submit)
+        return self._dataclass
+
+    def __repr__(self):
+        return f"FormTemplate({self._dataclass or self._tagdict!r})"
+
+
+def _fill(tagdict: TagDict, values: dict):
+    for key, val in values.items():
+        if key in tagdict:
+            target = tagdict[key]
+        elif key in tagdict.get("", {}):  # the fields of the main dataclass
+            target = tagdict[""][key]
+        else:
+            raise KeyError(f"The template has no field {key!r}")
+        if isinstance(target, dict):
+            _fill(target, val)
+        else:
+            target: Tag
+            target._set_val(val)
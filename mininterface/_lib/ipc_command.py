@@ -6,6 +6,7 @@ class IpcCommand(Enum):
     UI backend — both the Tk GUI and the Textual TUI use the same protocol."""
 
     FORM = "form"
+    FORM_VALUES = "form_values"  # parent → child: a form shaped like the previous FORM, its values only
     BUTTONS = "buttons"
     SHUTDOWN = "shutdown"
     RESULT = "result"
@@ -18,3 +19,5 @@ class IpcCommand(Enum):
     OUTPUT = "output"            # parent → child: live print() text to stream
     CLEAR_OUTPUT = "clear_output"  # parent → child: clear the streamed-output widget
     SETTINGS = "settings"        # parent → child: the UI settings (sent once after spawn)
+    PROGRESS = "progress"        # parent → child: a progress bar state (key, n, total, description, closed)
+    PUSH = "push"                # parent → child: tag values pushed while a dialog is open [(pos, val), ...]
@@ -3,6 +3,7 @@
 Subclasses supply _CHILD_CMD and UI-specific facet/settings annotations.
 The IPC protocol and pipe management are identical for all backends.
 """
+import asyncio
 import atexit
 import copy
 import io
@@ -11,12 +12,21 @@ import pickle
 import struct
 import subprocess
 import sys
-from typing import Any, NoReturn
+import threading
+import weakref
+from functools import partial
+from pathlib import PurePath
+from time import monotonic
+from types import BuiltinFunctionType, FunctionType
+from typing import Any, Callable, Coroutine, NoReturn, get_args, get_origin
 
 from .auxiliary import flatten
 from .form_dict import TagDict
 from .ipc_command import IpcCommand
+from .wire import _SCALARS, encode_form, fingerprint, form_values
 from ..exceptions import Cancelled
+from ..facet import Progress
+from ..tag.tag import Tag
 from .._mininterface.adaptor import BackendAdaptor
 
 
@@ -42,12 +52,71 @@ class _ChildSimUnpickler(pickle.Unpickler):
         return super().find_class(module, name)
 
 
+_REBUILD_BY_TYPE: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
+""" Memoised _child_can_rebuild verdicts of plain instances, per their type. """
+
+
+def _is_running(loop: asyncio.AbstractEventLoop) -> bool:
+    """Whether the loop runs in the current thread."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def _copy_form(form: TagDict) -> TagDict:
+    """Same-shaped form of shallow tag copies.
+
+    The copy goes through Tag.__getstate__, so it is already detached from the
+    facet and the source object; a deep copy would only duplicate values that
+    _safe_tag is about to replace and pickling is about to copy anyway."""
+    return {key: _copy_form(v) if isinstance(v, dict) else copy.copy(v) for key, v in form.items()}
+
+
 def _child_can_rebuild(obj) -> bool:
     """Whether the subprocess child could reconstruct obj from the pickle stream.
 
     False for a lambda/closure (unpicklable) or anything defined in the parent's
-    __main__ (a custom class/enum the user wrote in their script).  Reconstruction
-    uses __new__/__setstate__, not __init__, so this has no user side effects."""
+    __main__ (a custom class/enum the user wrote in their script).
+
+    The verdict depends on the type, not on the instance, so it is decided without
+    pickling where possible: builtins/stdlib scalars are safe, classes and functions
+    are pickled by reference (safe unless from __main__ or local), containers and
+    typing constructs are checked item by item.  An instance of a __main__ class is
+    unsafe; other instances are probed once per type (see _probe_rebuild) and the
+    verdict is memoised."""
+    t = type(obj)
+    if t in _SCALARS or isinstance(obj, PurePath):
+        return True
+    if t in (list, tuple, set, frozenset):
+        return all(_child_can_rebuild(v) for v in obj)
+    if t is dict:
+        return all(_child_can_rebuild(k) and _child_can_rebuild(v) for k, v in obj.items())
+    if isinstance(obj, (type, FunctionType, BuiltinFunctionType)):
+        return _is_importable(obj)
+    if get_origin(obj) is not None:  # list[int], Literal["a"], int | None, ...
+        return _child_can_rebuild(get_origin(obj)) and _child_can_rebuild(get_args(obj))
+    if not _is_importable(t):
+        return False
+    try:
+        return _REBUILD_BY_TYPE[t]
+    except KeyError:
+        pass
+    except TypeError:  # not weak-referenceable
+        return _probe_rebuild(obj)
+    verdict = _REBUILD_BY_TYPE[t] = _probe_rebuild(obj)
+    return verdict
+
+
+def _is_importable(obj) -> bool:
+    """A class or a function is pickled by reference: the child resolves it by its module and name."""
+    module = getattr(obj, "__module__", None)
+    return module != "__main__" and "<" not in getattr(obj, "__qualname__", "<")
+
+
+def _probe_rebuild(obj) -> bool:
+    """Pickle obj and unpickle it the way the child would.
+    Reconstruction uses __new__/__setstate__, not __init__, so this has no user side effects."""
     try:
         data = pickle.dumps(obj)
     except Exception:
@@ -72,12 +141,36 @@ class SubprocessAdaptorBase(BackendAdaptor):
         self._output_history: str = ""
         """ Full session stdout. Replayed to a freshly spawned child so its output
             area is restored after the window was closed and reopened. """
-        self._in_live_callback = False
-        """ True while a live on_change/validation callback runs in the parent.
-            The child's UI thread is parked in the proxy round-trip meanwhile, so
-            opening a nested dialog would deadlock — see _guard_reentrancy. """
+        self._live_callback_state = threading.local()
+        self._send_lock = threading.Lock()
+        """ Any thread may write (a print() streamed as OUTPUT); the reads are done
+            by the thread having the dialog turn only (see BackendAdaptor._dialogs). """
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        """ The event loop awaiting an a-method (Mininterface.aform, ...), see _wait_child. """
+        self._async_lock: asyncio.Lock | None = None
+        self._sent_shape: int | None = None
+        """ The fingerprint of the last form the child got (see _lib.wire.fingerprint). """
+        self._form_open = False
+        """ The child shows a form; the pushed values are sent to it. """
+        self._push_lock = threading.Lock()
+        self._pushed: dict[int, Tag] = {}
+        """ The tags pushed since the last send, by their id (see Tag.push). """
+        self._push_timer: threading.Timer | None = None
+        self._pushed_at = float("-inf")
         atexit.register(self._destroy)
 
+    @property
+    def _in_live_callback(self) -> bool:
+        """ True while a live on_change/validation callback runs in the parent (in this thread).
+            The child's UI thread is parked in the proxy round-trip meanwhile, so
+            opening a nested dialog would deadlock — see _guard_reentrancy.
+            Other threads are not concerned, their dialogs just wait for their turn. """
+        return getattr(self._live_callback_state, "active", False)
+
+    @_in_live_callback.setter
+    def _in_live_callback(self, value: bool) -> None:
+        self._live_callback_state.active = value
+
     def _record_output(self, text: str) -> None:
         """Accumulate output so it can be replayed to a respawned child."""
         if not text:
@@ -119,6 +212,7 @@ class SubprocessAdaptorBase(BackendAdaptor):
             os.close(res_w)
             self._write_fd = cmd_w
             self._read_fd = res_r
+            self._sent_shape = None
             spawned = True
 
         # (Re)wire stdout streaming. Done outside the spawn guard because an
@@ -170,6 +264,45 @@ class SubprocessAdaptorBase(BackendAdaptor):
                 except AttributeError:
                     pass
 
+    def _send_progress(self, progress: Progress) -> None:
+        """Ship the progress bar state to the child (spawning it if needed).
+        Parent-side hook for facet._show_progress; the Progress handle throttles the calls."""
+        try:
+            self._ensure_process()
+            self._send(IpcCommand.PROGRESS, id(progress), progress.n, progress.total,
+                       progress.description, progress.closed)
+        except OSError:
+            pass  # the child is gone, the next dialog respawns it
+
+    def _push_values(self, tags: list[Tag]) -> None:
+        """Send the new values of the tags to the open form. Thread-safe.
+        Parent-side hook for facet._push. At most UiSettings.push_rate sends a second,
+        the tags pushed in between are coalesced and sent with their latest value."""
+        with self._push_lock:
+            for tag in tags:
+                self._pushed[id(tag)] = tag
+            if self._push_timer is None:
+                interval = 1 / self.settings.push_rate if self.settings.push_rate else 0
+                delay = max(0, self._pushed_at + interval - monotonic())
+                self._push_timer = threading.Timer(delay, self._send_pushed)
+                self._push_timer.daemon = True
+                self._push_timer.start()
+
+    def _send_pushed(self) -> None:
+        with self._push_lock:
+            pushed, self._pushed = self._pushed, {}
+            self._push_timer = None
+            self._pushed_at = monotonic()
+        if not self._form_open:
+            return  # the next dialog reads the values from the tags
+        tags = list(flatten(self.facet._form or {}))
+        updates = [(i, t.val) for i, t in enumerate(tags) if id(t) in pushed]
+        if updates:
+            try:
+                self._send(IpcCommand.PUSH, self._labelize_updates(tags, updates))
+            except OSError:
+                pass  # the child is gone, the dialog ends
+
     # ------------------------------------------------------------------
     # Low-level I/O
     # ------------------------------------------------------------------
@@ -189,11 +322,12 @@ class SubprocessAdaptorBase(BackendAdaptor):
 
     def _send(self, *data) -> None:
         assert self._write_fd is not None
-        serialized = pickle.dumps(data)
+        serialized = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
         frame = struct.pack("!I", len(serialized)) + serialized
-        while frame:
-            n = os.write(self._write_fd, frame)
-            frame = frame[n:]
+        with self._send_lock:
+            while frame:
+                n = os.write(self._write_fd, frame)
+                frame = frame[n:]
 
     def _receive(self):
         header = self._read_exactly(4)
@@ -206,6 +340,60 @@ class SubprocessAdaptorBase(BackendAdaptor):
         command, *args = pickle.loads(payload)
         return command, args
 
+    async def _areceive(self):
+        """_receive for the event loop: await the child's message while the loop runs."""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        try:
+            loop.add_reader(self._read_fd, lambda: ready.done() or ready.set_result(None))
+        except NotImplementedError:  # a loop that cannot watch file descriptors
+            return await loop.run_in_executor(None, self._receive)
+        try:
+            await ready
+        finally:
+            loop.remove_reader(self._read_fd)
+        # The child writes a whole frame at once; the rest of it is just coming.
+        return self._receive()
+
+    async def _receive_blocking(self):
+        return self._receive()
+
+    def _wait_child(self, dialog: Callable[..., Coroutine]):
+        """Run the dialog coroutine, dialog(receive), to its end.
+
+        Awaited through an a-method (Mininterface.aform, ...), the dialog method runs
+        in a worker thread (see _arun). The coroutine is then handed to the awaiting
+        event loop: the loop reads the pipe without blocking and the on_change /
+        validation callbacks run on the loop.
+        Otherwise, the coroutine reads the pipe blocking, so it never suspends and
+        is run right here, without any event loop.
+        """
+        loop = self._async_loop
+        if loop is not None and not _is_running(loop):
+            return asyncio.run_coroutine_threadsafe(self._shared(dialog(self._areceive)), loop).result()
+        coro = dialog(self._receive_blocking)
+        try:
+            coro.send(None)
+        except StopIteration as e:
+            return e.value
+        coro.close()
+        raise RuntimeError("The dialog awaited outside of an event loop")
+
+    async def _shared(self, coro: Coroutine):
+        """Run the coroutine within this thread's dialog turn (see DialogScheduler.share)."""
+        with self._dialogs.share():
+            return await coro
+
+    async def _arun(self, method: Callable, *args, **kwargs):
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:  # _async_loop serves a single a-call at a time
+            self._async_loop = asyncio.get_running_loop()
+            try:
+                return await super()._arun(method, *args, **kwargs)
+            finally:
+                self._async_loop = None
+
     # ------------------------------------------------------------------
     # Form serialisation
     # ------------------------------------------------------------------
@@ -226,41 +414,59 @@ class SubprocessAdaptorBase(BackendAdaptor):
         user-defined classes (enums, dataclasses, …) those values are instances
         of.  The parent keeps the real tags and maps labels back to real values.
         """
+        form_copy = _copy_form(form)
+        for i, tag in enumerate(flatten(form_copy)):  # type: ignore[arg-type]
+            SubprocessAdaptorBase._safe_tag(tag, i)
+        return form_copy
+
+    @staticmethod
+    def _safe_tag(tag, i: int):
+        """Make a single tag (already a copy) safe to pickle to the child, see _safe_form.
+        i is the tag position in the flattened form.
+
+        The copy may share its value and annotation with the original tag
+        (see _copy_form), so they are only ever reassigned here, never mutated."""
         from .subprocess_child_base import _OnChangeProxy, _ValidationProxy
         from ..tag.select_tag import SelectTag
 
-        form_copy = copy.deepcopy(form)
-        for i, tag in enumerate(flatten(form_copy)):  # type: ignore[arg-type]
-            if getattr(tag, "on_change", None) is not None:
-                tag.on_change = _OnChangeProxy(i)
+        if getattr(tag, "on_change", None) is not None:
+            tag.on_change = _OnChangeProxy(i)
+
+        # Replace every validator with a proxy that round-trips to the parent.
+        # This keeps live FocusOut/Tab validation working for __main__ validators
+        # too — the child never calls the real function, just asks the parent.
+        if getattr(tag, "validation", None) is not None:
+            tag.validation = _ValidationProxy(i)
+
+        if isinstance(tag, SelectTag):
+            SubprocessAdaptorBase._labelize_select(tag)
+        elif callable(getattr(tag, "val", None)):
+            # A button action: the child only needs to know it is callable.
+            # The original annotation is the function's own type (unpicklable
+            # and child-specific); clear it — val being a function is enough
+            # for the child to recognise a button.
+            tag.val = tag._original_val = _stripped_callback
+            tag.annotation = None
+        elif not _child_can_rebuild(tag.val):
+            # A custom-class value (e.g. a user object defined in __main__):
+            # the child only renders it as an editable string, and the
+            # parent's real tag rebuilds the object from that string on
+            # submit (Tag.update → annotation(ui_value)).  So send the
+            # string and drop the child-unreachable annotation.
+            tag.val = str(tag.val)
+            tag._original_val = str(tag._original_val) if tag._original_val is not None else None
+            tag._last_ui_val = None
+            if not _child_can_rebuild(tag.annotation):
+                tag.annotation = None
+        return tag
 
-            # Replace every validator with a proxy that round-trips to the parent.
-            # This keeps live FocusOut/Tab validation working for __main__ validators
-            # too — the child never calls the real function, just asks the parent.
-            if getattr(tag, "validation", None) is not None:
-                tag.validation = _ValidationProxy(i)
+    @staticmethod
+    def _wire_form(form: TagDict) -> dict:
+        """Encode the form for the FORM message.
 
-            if isinstance(tag, SelectTag):
-                SubprocessAdaptorBase._labelize_select(tag)
-            elif callable(getattr(tag, "val", None)):
-                # A button action: the child only needs to know it is callable.
-                # The original annotation is the function's own type (unpicklable
-                # and child-specific); clear it — val being a function is enough
-                # for the child to recognise a button.
-                tag.val = tag._original_val = _stripped_callback
-                tag.annotation = None
-            elif not _child_can_rebuild(tag.val):
-                # A custom-class value (e.g. a user object defined in __main__):
-                # the child only renders it as an editable string, and the
-                # parent's real tag rebuilds the object from that string on
-                # submit (Tag.update → annotation(ui_value)).  So send the
-                # string and drop the child-unreachable annotation.
-                tag.val = str(tag.val)
-                tag._original_val = str(tag._original_val) if tag._original_val is not None else None
-                tag._last_ui_val = None
-                if not _child_can_rebuild(tag.annotation):
-                    tag.annotation = None
-        return form_copy
+        Tags made of builtins/stdlib types only travel as compact TagWire records
+        (see _lib.wire); the rest falls back to a _safe_tag pickled copy."""
+        return encode_form(form, lambda tag, i: SubprocessAdaptorBase._safe_tag(copy.copy(tag), i))
 
     @staticmethod
     def _value_to_label(tag, value):
@@ -314,14 +520,17 @@ class SubprocessAdaptorBase(BackendAdaptor):
 
     @staticmethod
     def _labelize_updates(tags, updates):
-        """Convert (pos, real_value) FORM_UPDATE pairs to labels for SelectTags so
-        the child (which renders labels) can apply them."""
+        """Convert (pos, real_value) FORM_UPDATE pairs to labels for SelectTags
+        and to cells for TableTags so the child (which renders these) can apply them."""
         from ..tag.select_tag import SelectTag
+        from ..tag.table_tag import TableTag
         out = []
         for pos, val in updates:
             tag = tags[pos] if 0 <= pos < len(tags) else None
             if isinstance(tag, SelectTag):
                 val = SubprocessAdaptorBase._value_to_label(tag, val)
+            elif isinstance(tag, TableTag):
+                val = tag._get_ui_val()
             out.append((pos, val))
         return out
 
@@ -364,11 +573,15 @@ class SubprocessAdaptorBase(BackendAdaptor):
             )
 
     def _handle_callback(self, callback_type: str, tag_pos: int, *extra) -> str:
-        """Process a CALLBACK message from the child. Returns 'continue', 'done', or 'retry'."""
+        """Process a CALLBACK message from the child. Returns 'continue', 'done', or 'retry'.
+
+        extra is (ui value,) or (ui value, seq) — the child's non-blocking proxies
+        number their requests (see _LiveCallbacks) and the reply echoes the number."""
         from ..exceptions import ValidationFail
 
         tags = list(flatten(self.facet._form))  # type: ignore[arg-type]
         orig_vals = [t.val for t in tags]
+        seq = extra[1:2]
 
         if callback_type == "validate" and 0 <= tag_pos < len(tags):
             tag = tags[tag_pos]
@@ -385,15 +598,16 @@ class SubprocessAdaptorBase(BackendAdaptor):
                 self._in_live_callback = False
                 # Always answer the child's round-trip, even if the validator raised —
                 # otherwise its _ValidationProxy would block forever.
-                self._send(IpcCommand.VALIDATE_RESULT, result)
+                self._send(IpcCommand.VALIDATE_RESULT, result, *seq)
             return "continue"
 
         if callback_type == "on_change" and 0 <= tag_pos < len(tags):
             tag = tags[tag_pos]
             new = extra[0] if extra else None
-            tag.update(self._resolve_select_labels([tag], [new])[0])
+            # A non-blocking child has not waited for the validation, check it here.
+            updated = tag.update(self._resolve_select_labels([tag], [new])[0])
             try:
-                if tag.on_change:
+                if updated and tag.on_change:
                     self._in_live_callback = True  # refuse nested dialogs (see _guard_reentrancy)
                     try:
                         tag.on_change(tag)
@@ -404,7 +618,7 @@ class SubprocessAdaptorBase(BackendAdaptor):
                 # otherwise its _OnChangeProxy would block forever.
                 updates = [(i, t.val) for i, t in enumerate(tags) if t.val != orig_vals[i]]
                 updates = self._labelize_updates(tags, updates)
-                self._send(IpcCommand.FORM_UPDATE, updates, self.facet._title)
+                self._send(IpcCommand.FORM_UPDATE, updates, self.facet._title, *seq)
             return "continue"
 
         if callback_type == "button" and 0 <= tag_pos < len(tags):
@@ -430,8 +644,14 @@ class SubprocessAdaptorBase(BackendAdaptor):
 
     def run_dialog(self, form: TagDict, title: str = "", submit: bool | str = True) -> TagDict:
         self._guard_reentrancy()
-        self._ensure_process()
-        BackendAdaptor.run_dialog(self, form, title, submit)
+        with self._dialogs.turn():
+            self._ensure_process()
+            BackendAdaptor.run_dialog(self, form, title, submit)
+            return self._wait_child(partial(self._dialog, form, title, submit))
+
+    async def _dialog(self, form: TagDict, title: str, submit: bool | str, receive) -> TagDict:
+        """Show the form and process the child's messages until it is submitted.
+        receive: an async _receive (see _wait_child)."""
         always_shown = getattr(self.interface, "_always_shown", False)
 
         try:
@@ -441,17 +661,25 @@ class SubprocessAdaptorBase(BackendAdaptor):
                 raw_layout = list(self.facet._raw_layout)
                 self.facet._raw_layout.clear()
 
-                safe_form = self._safe_form(self.facet._form or {})
+                wire_form = self._wire_form(self.facet._form or {})
                 effective_title = self.facet._title or title
                 program_title = getattr(self.interface, "title", None)
                 # This dialog re-renders the output area, so everything streamed so far
                 # is now shown — drop it from the not-yet-rendered tail.
                 self._confirm_streamed()
-                self._send(IpcCommand.FORM, safe_form, effective_title, submit, redirected,
-                           raw_layout, always_shown, program_title)
-
+                shape = fingerprint(wire_form)
+                if shape is not None and shape == self._sent_shape:
+                    # The child has this form already, it needs the values only.
+                    self._send(IpcCommand.FORM_VALUES, form_values(wire_form), effective_title, submit, redirected,
+                               raw_layout, always_shown, program_title, shape)
+                else:
+                    self._send(IpcCommand.FORM, wire_form, effective_title, submit, redirected,
+                               raw_layout, always_shown, program_title, shape)
+                self._sent_shape = shape
+
+                self._form_open = True
                 while True:
-                    command, args = self._receive()
+                    command, args = await receive()
 
                     if command == IpcCommand.RESULT:
                         ui_vals = args[0]  # type: ignore[index]
@@ -481,11 +709,16 @@ class SubprocessAdaptorBase(BackendAdaptor):
                         self._on_cancel()
                         raise Cancelled
         finally:
+            self._form_open = False
             self._maybe_release_terminal(always_shown)
 
     def buttons(self, text: str, buttons: list[tuple[str, Any]], focused: int = 1, *, timeout: int = 0):
         self._guard_reentrancy()
-        self._ensure_process()
+        with self._dialogs.turn():
+            self._ensure_process()
+            return self._wait_child(partial(self._buttons_dialog, text, buttons, focused, timeout))
+
+    async def _buttons_dialog(self, text: str, buttons: list[tuple[str, Any]], focused: int, timeout: int, receive):
         redirected = self._get_redirected()
         self._record_output(redirected)
         # A buttons dialog (confirm/alert/yes_no) can carry a facet._layout too —
@@ -498,7 +731,7 @@ class SubprocessAdaptorBase(BackendAdaptor):
         self._confirm_streamed()
         self._send(IpcCommand.BUTTONS, text, buttons, focused, timeout, redirected,
                    raw_layout, always_shown, program_title)
-        command, args = self._receive()
+        command, args = await receive()
         try:
             if command == IpcCommand.QUIT:
                 self._on_cancel()
@@ -518,6 +751,7 @@ class SubprocessAdaptorBase(BackendAdaptor):
         widget value, …) instead of a misleading Cancelled. The child's traceback
         travels along as the exception's __cause__."""
         self._on_cancel()
+        self._sent_shape = None  # the next form travels whole
         exc = args[0] if args else None
         tb = args[1] if len(args) > 1 else ""
         cause = RuntimeError("the UI subprocess hit an error while building the dialog:\n"
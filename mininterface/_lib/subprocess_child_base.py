@@ -2,11 +2,15 @@
 
 The child process of every subprocess backend needs the same things:
 
-* the low-level framed pipe protocol (length-prefixed pickle),
+* the low-level framed pipe protocol (length-prefixed pickle; forms travel in
+  the compact wire format of ``_lib.wire``),
 * the file descriptors it talks to the parent through,
 * an ``_OnChangeProxy`` that is pickled into the form in place of a real
   ``on_change`` callback and, when fired, does a brief blocking round-trip with
-  the parent (which owns the real callback).
+  the parent (which owns the real callback).  With
+  ``UiSettings.live_callback_delay`` set, the proxies do not block: the request
+  is debounced and sent by ``_LiveCallbacks``, and the IPC worker reads the
+  reply while it waits for the dialog to end (see :func:`wait_submitted`).
 
 Only the *effect* of an update differs per backend (how a value is pushed back
 into a Textual widget vs. a Tk variable, where print() output is shown).  Those
@@ -14,7 +18,9 @@ two operations are injected as hooks via :func:`register_hooks`.
 """
 import os
 import pickle
+import select
 import struct
+import threading
 import traceback
 from typing import Callable, Optional
 
@@ -29,6 +35,13 @@ _apply_form_update: Optional[Callable[[list, str], None]] = None
 """ (updates, title) -> None — push parent's new tag values into the live widgets. """
 _append_output: Optional[Callable[[str], None]] = None
 """ (text) -> None — show a chunk of redirected print() output. """
+_show_progress: Optional[Callable[..., None]] = None
+""" (key, n, total, description, closed) -> None — draw a facet.progress bar. """
+_editing: Optional[Callable[[], int | None]] = None
+""" () -> the position of the tag whose widget has the focus, or None. Pushed values skip it. """
+_call_in_ui: Optional[Callable[..., None]] = None
+""" (fn, *args) -> None — run fn on the UI thread. Needed when a reply is read by the
+    IPC worker (the non-blocking proxy mode) instead of the UI thread itself. """
 _shutdown: Optional[Callable[[], None]] = None
 """ () -> None — tear down the app and restore the terminal. Called when a proxy
     round-trip is interrupted by a SHUTDOWN (the parent is exiting while the child's
@@ -42,6 +55,13 @@ _proxies_active: bool = True
     the proxy read loop so app.exit() never runs and the terminal is left corrupted.
     Suppressing proxies during submit avoids the race; the parent re-validates the
     whole form on submit anyway. """
+_read_lock = threading.RLock()
+""" Held by a blocking proxy for its whole round-trip so that the IPC worker,
+    reading the pipe while a dialog is open, does not take the reply. """
+_live_callback_delay: float | None = None
+""" UiSettings.live_callback_delay, received with the SETTINGS message.
+    None → the proxies do a blocking round-trip on the UI thread.
+    Seconds → the proxies hand the request to _live and return at once. """
 
 
 def set_proxies_active(active: bool) -> None:
@@ -50,17 +70,38 @@ def set_proxies_active(active: bool) -> None:
     _proxies_active = active
 
 
+def set_live_callback_delay(delay: float | None) -> None:
+    """Switch the proxies between the blocking (None) and the debounced mode (see _LiveCallbacks)."""
+    global _live_callback_delay
+    _live_callback_delay = delay
+
+
 def register_hooks(read_fd: int, write_fd: int,
                    apply_form_update: Callable[[list, str], None],
                    append_output: Callable[[str], None],
-                   shutdown: Optional[Callable[[], None]] = None) -> None:
+                   shutdown: Optional[Callable[[], None]] = None,
+                   call_in_ui: Optional[Callable[..., None]] = None,
+                   show_progress: Optional[Callable[..., None]] = None,
+                   editing: Optional[Callable[[], int | None]] = None) -> None:
     """Wire the child's FDs and backend-specific callbacks into this module."""
-    global _CHILD_WRITE_FD, _CHILD_READ_FD, _apply_form_update, _append_output, _shutdown
+    global _CHILD_WRITE_FD, _CHILD_READ_FD, _apply_form_update, _append_output, _shutdown, _call_in_ui
+    global _show_progress, _editing
     _CHILD_READ_FD = read_fd
     _CHILD_WRITE_FD = write_fd
     _apply_form_update = apply_form_update
     _append_output = append_output
     _shutdown = shutdown
+    _call_in_ui = call_in_ui
+    _show_progress = show_progress
+    _editing = editing
+
+
+def _in_ui(fn: Callable, *args) -> None:
+    """Run fn on the UI thread (directly, if the backend registered no call_in_ui hook)."""
+    if _call_in_ui is None:
+        fn(*args)
+    else:
+        _call_in_ui(fn, *args)
 
 
 def _request_shutdown() -> None:
@@ -96,7 +137,7 @@ def read_msg(fd: int):
 
 
 def send_msg(fd: int, data) -> None:
-    serialized = pickle.dumps(data)
+    serialized = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
     frame = struct.pack("!I", len(serialized)) + serialized
     while frame:
         n = os.write(fd, frame)
@@ -118,6 +159,31 @@ def error_payload(exc: BaseException) -> tuple:
     return (IpcCommand.ERROR, exc, tb)
 
 
+# ---------------------------------------------------------------------------
+# Messages the parent sends on its own while a dialog is open
+# ---------------------------------------------------------------------------
+
+def _handle_unsolicited(command: IpcCommand, args: list) -> None:
+    """Show an OUTPUT, PROGRESS or PUSH message. Runs on the UI thread, other commands are ignored."""
+    if command == IpcCommand.OUTPUT:
+        if _append_output is not None:
+            _append_output(args[0])
+    elif command == IpcCommand.PROGRESS:
+        if _show_progress is not None:
+            _show_progress(*args)
+    elif command == IpcCommand.PUSH:
+        _apply_pushed(args[0])
+
+
+def _apply_pushed(updates: list) -> None:
+    """Show the values pushed from the parent (see Tag.push), except for the field the user is editing."""
+    if _apply_form_update is None:
+        return
+    editing = _editing() if _editing is not None else None
+    if updates := [(pos, val) for pos, val in updates if pos != editing]:
+        _apply_form_update(updates, "")
+
+
 # ---------------------------------------------------------------------------
 # Callback proxies (on_change and validation)
 # ---------------------------------------------------------------------------
@@ -137,26 +203,30 @@ class _ValidationProxy:
     def __call__(self, tag):
         if not _proxies_active:
             return True  # submit/shutdown in progress — parent re-validates on submit
+        if _live_callback_delay is not None:
+            # Optimistic: the verdict is applied to the tag once the reply comes.
+            _live.schedule("validate", self.tag_pos, tag)
+            return True
         assert _CHILD_WRITE_FD is not None
         assert _CHILD_READ_FD is not None
-        send_msg(_CHILD_WRITE_FD, (IpcCommand.CALLBACK, "validate", self.tag_pos, tag.val))
-        while True:
-            response = read_msg(_CHILD_READ_FD)
-            if not response:
-                return True  # pipe closed — don't block the UI
-            if response[0] == IpcCommand.SHUTDOWN:
-                # Parent is tearing down (the form was already submitted/cancelled on
-                # another path). Re-dispatch to the app so it exits and restores the
-                # terminal, then unblock the main thread instead of parking here.
-                _request_shutdown()
-                return True
-            command, *args = response
-            if command == IpcCommand.VALIDATE_RESULT:
-                # None → ok; str → error message (shown inline by tag.update)
-                return args[0]
-            elif command == IpcCommand.OUTPUT:
-                if _append_output is not None:
-                    _append_output(args[0])
+        with _read_lock:  # the reply is ours, not the IPC worker's (see wait_submitted)
+            send_msg(_CHILD_WRITE_FD, (IpcCommand.CALLBACK, "validate", self.tag_pos, tag.val))
+            while True:
+                response = read_msg(_CHILD_READ_FD)
+                if not response:
+                    return True  # pipe closed — don't block the UI
+                if response[0] == IpcCommand.SHUTDOWN:
+                    # Parent is tearing down (the form was already submitted/cancelled on
+                    # another path). Re-dispatch to the app so it exits and restores the
+                    # terminal, then unblock the main thread instead of parking here.
+                    _request_shutdown()
+                    return True
+                command, *args = response
+                if command == IpcCommand.VALIDATE_RESULT:
+                    # None → ok; str → error message (shown inline by tag.update)
+                    return args[0]
+                else:
+                    _handle_unsolicited(command, args)  # ex. print() in the validator
 
 
 class _OnChangeProxy:
@@ -174,29 +244,169 @@ class _OnChangeProxy:
     def __call__(self, tag):
         if not _proxies_active:
             return  # submit/shutdown in progress — skip the round-trip
+        if _live_callback_delay is not None:
+            _live.schedule("on_change", self.tag_pos, tag)
+            return
         assert _CHILD_WRITE_FD is not None
         assert _CHILD_READ_FD is not None
-        send_msg(_CHILD_WRITE_FD, (IpcCommand.CALLBACK, "on_change", self.tag_pos, tag.val))
-        while True:
-            response = read_msg(_CHILD_READ_FD)
-            if not response:
-                return
-            command, *args = response
-            if command == IpcCommand.SHUTDOWN:
-                # The parent is tearing down (e.g. the form was already submitted on
-                # another path and the parent moved on). Re-dispatch SHUTDOWN to the
-                # app so it exits and restores the terminal, then unblock. Without
-                # this the main thread stays parked here and app.exit() never runs.
-                _request_shutdown()
+        with _read_lock:  # the reply is ours, not the IPC worker's (see wait_submitted)
+            send_msg(_CHILD_WRITE_FD, (IpcCommand.CALLBACK, "on_change", self.tag_pos, tag.val))
+            while True:
+                response = read_msg(_CHILD_READ_FD)
+                if not response:
+                    return
+                command, *args = response
+                if command == IpcCommand.SHUTDOWN:
+                    # The parent is tearing down (e.g. the form was already submitted on
+                    # another path and the parent moved on). Re-dispatch SHUTDOWN to the
+                    # app so it exits and restores the terminal, then unblock. Without
+                    # this the main thread stays parked here and app.exit() never runs.
+                    _request_shutdown()
+                    return
+                if command == IpcCommand.FORM_UPDATE:
+                    if _apply_form_update is not None:
+                        _apply_form_update(args[0], args[1] if len(args) > 1 else "")
+                    return
+                else:
+                    # OUTPUT can arrive here if print() was called inside the on_change callback.
+                    _handle_unsolicited(command, args)
+
+
+class _LiveCallbacks:
+    """The non-blocking proxy mode: debounced on_change/validation requests.
+
+    A proxy fired on the UI thread only records the tag and (re)starts its timer,
+    so rapid successive changes of the same tag are coalesced and only the latest
+    value is sent, once the tag stays unchanged for the delay.  Every request
+    carries a sequence number the parent echoes in its reply.  A reply outdated by
+    a newer change of the same tag is stale: a VALIDATE_RESULT is dropped, a
+    FORM_UPDATE is applied except for the tag itself, so the value the user has
+    typed since is not overwritten.  A reply arriving after its dialog ended is dropped.
+
+    The replies are read by the IPC worker while it waits for the dialog to end
+    (see wait_submitted); requests are only sent while that dialog is open, so none
+    can reach the parent after the RESULT.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        """ Guards the state below and the writes to the pipe. """
+        self.open = False
+        self.seq = 0
+        self.timers: dict[tuple[str, int], threading.Timer] = {}
+        self.latest: dict[tuple[str, int], int] = {}
+        """ key → seq of the last request sent """
+        self.sent: dict[int, tuple[tuple[str, int], object]] = {}
+        """ seq → (key, tag) of the requests waiting for a reply """
+
+    def open_dialog(self) -> None:
+        with self.lock:
+            self.open = True
+
+    def close_dialog(self) -> None:
+        """Drop the pending requests and forget those waiting for a reply.
+        Their replies, if any, are ignored by _ipc_worker_loop."""
+        with self.lock:
+            self.open = False
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
+            self.latest.clear()
+            self.sent.clear()
+
+    def schedule(self, kind: str, tag_pos: int, tag) -> None:
+        key = (kind, tag_pos)
+        with self.lock:
+            if not self.open:
                 return
-            if command == IpcCommand.FORM_UPDATE:
-                if _apply_form_update is not None:
-                    _apply_form_update(args[0], args[1] if len(args) > 1 else "")
+            if timer := self.timers.get(key):
+                timer.cancel()
+            timer = self.timers[key] = threading.Timer(_live_callback_delay or 0, self._send, (key, tag, tag.val))
+            timer.daemon = True
+            timer.start()
+
+    def _send(self, key: tuple[str, int], tag, val) -> None:
+        with self.lock:
+            # Superseded by a newer change (or the dialog has ended) meanwhile.
+            if not self.open or self.timers.get(key) is not threading.current_thread():
                 return
-            elif command == IpcCommand.OUTPUT:
-                # OUTPUT can arrive here if print() was called inside the on_change callback.
-                if _append_output is not None:
-                    _append_output(args[0])
+            del self.timers[key]
+            self.seq += 1
+            self.latest[key] = self.seq
+            self.sent[self.seq] = key, tag
+            try:
+                send_msg(_CHILD_WRITE_FD, (IpcCommand.CALLBACK, key[0], key[1], val, self.seq))
+            except OSError:
+                pass  # the parent is gone, the worker handles the EOF
+
+    def dispatch(self, command: IpcCommand, args: list) -> None:
+        """Apply a reply the IPC worker has read."""
+        if command in (IpcCommand.OUTPUT, IpcCommand.PROGRESS, IpcCommand.PUSH):
+            _in_ui(_handle_unsolicited, command, args)
+            return
+        if command not in (IpcCommand.VALIDATE_RESULT, IpcCommand.FORM_UPDATE) or len(args) < 2:
+            return
+        seq = args[-1]
+        with self.lock:
+            entry = self.sent.pop(seq, None)
+            if entry is None:
+                return  # a reply to a request of an earlier dialog
+            key, tag = entry
+            # Not outdated by a newer request, neither sent nor pending.
+            current = self.latest.get(key) == seq and key not in self.timers
+        if command == IpcCommand.VALIDATE_RESULT:
+            if current:
+                _in_ui(_apply_validation_result, tag, args[0])
+        elif _apply_form_update is not None:
+            updates, title = args[0], args[1]
+            if not current:
+                updates = [(pos, val) for pos, val in updates if pos != key[1]]
+            _in_ui(_apply_form_update, updates, title)
+
+
+_live = _LiveCallbacks()
+
+
+def _apply_validation_result(tag, result) -> None:
+    """Show the verdict of a live validation on the child's tag copy."""
+    if result is True:
+        tag.remove_error_text()
+    else:
+        tag.set_error_text(result or "Validation fail")
+
+
+def wait_submitted(submitted: threading.Event) -> None:
+    """Park the IPC worker until the dialog ends (submitted is set by the UI thread).
+
+    Meanwhile, the worker reads what the parent sends on its own (output, progress,
+    pushed values) and, in the non-blocking proxy mode, the replies to the proxy
+    requests, so the UI thread never blocks on the pipe. A blocking proxy reads its
+    reply itself, holding _read_lock."""
+    if _CHILD_READ_FD is None:
+        submitted.wait()
+        return
+    _live.open_dialog()
+    try:
+        while not submitted.is_set():
+            try:
+                if not select.select([_CHILD_READ_FD], [], [], 0.05)[0]:
+                    continue
+            except (OSError, ValueError):  # no pipe to read
+                break
+            with _read_lock:
+                if not select.select([_CHILD_READ_FD], [], [], 0)[0]:
+                    continue  # a blocking proxy has read it meanwhile
+                response = read_msg(_CHILD_READ_FD)
+            if not response or response[0] == IpcCommand.SHUTDOWN:
+                # The parent is tearing down. Exit the app (restoring the terminal),
+                # exactly like a blocking proxy interrupted by a SHUTDOWN does.
+                _request_shutdown()
+                break
+            command, *args = response
+            _live.dispatch(command, args)
+    finally:
+        _live.close_dialog()
+    submitted.wait()
 
 
 def _ipc_worker_loop(read_fd: int, write_fd: int, handlers: dict) -> None:
@@ -210,9 +420,11 @@ def _ipc_worker_loop(read_fd: int, write_fd: int, handlers: dict) -> None:
         read_fd: pipe fd to read commands from
         write_fd: pipe fd to send results to
         handlers: dict with keys 'OUTPUT', 'CLEAR_OUTPUT', 'SETTINGS', 'FORM',
-            'BUTTONS', 'on_eof'.
+            'BUTTONS', 'on_eof' and optionally 'PROGRESS'.
             Each handler is called with the parsed args from the message.
+            A FORM_VALUES message is handed to the 'FORM' handler too.
     """
+    shown = None  # the encoded form of the last FORM message
     while True:
         msg = read_msg(read_fd)
         if msg is None:
@@ -233,12 +445,34 @@ def _ipc_worker_loop(read_fd: int, write_fd: int, handlers: dict) -> None:
             handlers['CLEAR_OUTPUT']()
             continue
 
+        if command == IpcCommand.PROGRESS:
+            if progress := handlers.get('PROGRESS'):
+                progress(*args)
+            continue
+
+        if command == IpcCommand.PUSH:
+            continue  # the values of a dialog that has ended meanwhile
+
         if command == IpcCommand.SETTINGS:
+            set_live_callback_delay(getattr(args[0], "live_callback_delay", None))
             handlers['SETTINGS'](args[0])
             continue
 
         try:
             if command == IpcCommand.FORM:
+                # The form arrives in the wire format (see _lib.wire); hand the
+                # handler a TagDict, as the backends expect.
+                from .wire import decode_form
+                if args:
+                    shown = args[0]
+                    args[0] = decode_form(shown)
+                handlers['FORM'](write_fd, *args)
+            elif command == IpcCommand.FORM_VALUES:
+                # The same form as the last time, only the values travel.
+                from .wire import decode_form, with_values
+                if shown is None:
+                    raise RuntimeError("Received the form values before the form")
+                args[0] = decode_form(with_values(shown, args[0]))
                 handlers['FORM'](write_fd, *args)
             elif command == IpcCommand.BUTTONS:
                 handlers['BUTTONS'](write_fd, *args)
@@ -0,0 +1,299 @@
+"""Compact wire format for forms sent to a subprocess UI child.
+
+Instead of pickling whole Tag objects (with their dataclass state, sources and
+callbacks), the parent encodes each tag into a small slotted record that carries
+only what the child renders: the tag kind, label, description, the value, the
+annotation, SelectTag labels with an index handle to the selected one(s), TableTag
+rows as cells, the mnemonic and the error text.  The child rebuilds a plain Tag of the same kind
+from the record (see decode_form).
+
+Only tags whose every part is built from builtins/stdlib types travel this way.
+Anything else (a user Tag subclass, a custom-class value or annotation) is
+handed to the fallback (the pickle path of SubprocessAdaptorBase._safe_form)
+and travels as a Tag, as before.  The decision is a plain type check — no trial
+pickling is needed.
+"""
+from dataclasses import fields
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import PurePath
+from types import NoneType, UnionType
+from typing import TYPE_CHECKING, Callable, Literal, Union, get_args, get_origin
+
+from .dict_utils import flatten
+
+if TYPE_CHECKING:
+    from .form_dict import TagDict
+    from ..tag.tag import Tag
+
+_SCALARS = frozenset((str, int, float, bool, bytes, complex, NoneType, Decimal, date, datetime, time, timedelta))
+_CONTAINERS = (list, tuple, set, frozenset)
+_SAFE_MODULES = frozenset(("builtins", "pathlib", "datetime", "decimal", "types", "typing", "collections.abc", "enum"))
+
+ON_CHANGE = 1
+""" The tag has an on_change callback (the child installs an _OnChangeProxy). """
+VALIDATION = 2
+""" The tag has a validation (the child installs a _ValidationProxy). """
+BUTTON = 4
+""" The value is a callable; the child renders a button (see _stripped_callback). """
+
+
+class TagWire:
+    """One tag as it travels to the child.
+
+    Pickled as a bare argument tuple (see __reduce__), so a form of N tags costs
+    one class reference plus N small tuples.
+    """
+
+    __slots__ = ("kind", "label", "description", "val", "annotation", "options",
+                 "mnemonic", "error_text", "flags", "extra")
+
+    def __init__(self, kind: str, label, description: str, val, annotation, options: tuple | None,
+                 mnemonic, error_text: str | None, flags: int, extra: tuple):
+        self.kind = kind
+        """ Tag class name, a key of _kinds(). """
+        self.label = label
+        """ Label before any error mark (see Tag.set_error_text). """
+        self.description = description
+        """ Description before any error text. """
+        self.val = val
+        """ The value. For a SelectTag, an index (or a list of indices) into options. """
+        self.annotation = annotation
+        self.options = options
+        """ SelectTag option labels (str or tuple of str). """
+        self.mnemonic = mnemonic
+        self.error_text = error_text
+        """ None if the tag passed the last validation. """
+        self.flags = flags
+        """ Bitmask of ON_CHANGE, VALIDATION, BUTTON. """
+        self.extra = extra
+        """ (name, value) pairs of the fields the kind adds to Tag, ex. PathTag.is_dir.
+            For a SelectTag, the tips are given here as indices into options. """
+
+    def __reduce__(self):
+        return TagWire, tuple(getattr(self, s) for s in self.__slots__)
+
+    def __repr__(self):
+        return f"TagWire({self.kind}, {self.label!r}, val={self.val!r})"
+
+
+@lru_cache(maxsize=None)
+def _kinds() -> dict[str, type]:
+    """Tag classes the child can rebuild from a TagWire."""
+    from ..tag import CallbackTag, DatetimeTag, PathTag, SecretTag, SelectTag, TableTag, Tag
+    return {cl.__name__: cl for cl in (Tag, CallbackTag, DatetimeTag, PathTag, SecretTag, SelectTag, TableTag)}
+
+
+@lru_cache(maxsize=None)
+def _extra_fields(cls: type) -> tuple[str, ...]:
+    """Dataclass fields a Tag subclass adds to the base Tag, ex. ('multiple', 'exist', ...) for PathTag."""
+    from ..tag.tag import Tag
+    base = {f.name for f in fields(Tag)}
+    return tuple(f.name for f in fields(cls) if f.name not in base and f.name not in ("options", "tips", "row_validation"))
+
+
+def is_wire_value(val) -> bool:
+    """Whether the value is built from builtins/stdlib types only."""
+    t = type(val)
+    if t in _SCALARS:
+        return True
+    if isinstance(val, PurePath):
+        return True
+    if t in _CONTAINERS:
+        return all(is_wire_value(v) for v in val)
+    if t is dict:
+        return all(is_wire_value(k) and is_wire_value(v) for k, v in val.items())
+    return False
+
+
+def is_wire_annotation(annotation) -> bool:
+    """Whether the annotation is built from builtins/stdlib types only (`list[Path] | None`, ...)."""
+    try:
+        return _is_wire_annotation(annotation)
+    except TypeError:  # unhashable annotation, ex. a Literal of lists
+        return _is_wire_annotation.__wrapped__(annotation)
+
+
+@lru_cache(maxsize=1024)
+def _is_wire_annotation(annotation) -> bool:
+    if annotation is None or annotation is Ellipsis:
+        return True
+    if origin := get_origin(annotation):
+        args = get_args(annotation)
+        if origin is Literal:
+            return all(is_wire_value(arg) for arg in args)
+        if origin is Union or origin is UnionType:
+            return all(is_wire_annotation(arg) for arg in args)
+        return is_wire_annotation(origin) and all(is_wire_annotation(arg) for arg in args)
+    if isinstance(annotation, type):
+        return annotation.__module__ in _SAFE_MODULES or annotation.__module__.startswith("pathlib")
+    return False
+
+
+def encode_tag(tag: "Tag", fallback: Callable[["Tag"], "Tag"]) -> "TagWire | Tag":
+    """Encode a tag for the wire, or return fallback(tag) if it cannot travel as a TagWire."""
+    from ..tag.select_tag import SelectTag
+    from ..tag.table_tag import TableTag
+
+    cls = type(tag)
+    if _kinds().get(cls.__name__) is not cls:
+        return fallback(tag)
+
+    flags = (ON_CHANGE if tag.on_change is not None else 0) | (VALIDATION if tag.validation is not None else 0)
+    annotation = tag.annotation
+    options = None
+    extra = tuple((name, getattr(tag, name)) for name in _extra_fields(cls))
+
+    if isinstance(tag, SelectTag):
+        # The child renders and returns labels only; the parent maps them back
+        # to the real option values (SubprocessAdaptorBase._resolve_select_labels).
+        try:
+            built = tag._build_options()
+        except Exception:
+            return fallback(tag)
+        options = tuple(built)
+        values = list(built.values())
+
+        def index(v):
+            return next((i for i, o in enumerate(values) if o == v), None)
+
+        if tag.multiple:
+            seq = tag.val if isinstance(tag.val, (list, tuple, set)) else []
+            val = [i for i, v in enumerate(values) if v in seq]
+        else:
+            val = index(tag.val)
+        if tag.tips is not None:
+            extra += (("tips", [i for t in tag.tips if (i := index(t)) is not None]),)
+    elif isinstance(tag, TableTag):
+        # The child renders and returns cells only; the parent converts them to the records.
+        val, annotation = tag._get_ui_val(), None
+    elif tag._is_a_callable():
+        # A button: the child only needs to know it is callable.
+        val, annotation = None, None
+        flags |= BUTTON
+    else:
+        val = tag.val
+        if not is_wire_value(val):
+            return fallback(tag)
+
+    if not is_wire_annotation(annotation) or not all(
+        is_wire_value(v) or is_wire_annotation(v) for _, v in extra
+    ):
+        return fallback(tag)
+
+    if tag._error_text is None:
+        label, description = tag.label, tag.description
+    else:
+        label, description = tag._original_label, tag._original_desc
+    return TagWire(cls.__name__, label, description, val, annotation, options,
+                   tag.mnemonic, tag._error_text, flags, extra)
+
+
+def encode_form(form: "TagDict", fallback: Callable[["Tag", int], "Tag"], _pos: list | None = None) -> dict:
+    """Encode the form into a same-shaped dict of TagWires (or fallback tags).
+
+    Args:
+        fallback: (tag, flat position) -> a child-safe copy of the tag.
+    """
+    pos = _pos if _pos is not None else [0]
+    out = {}
+    for key, v in form.items():
+        if isinstance(v, dict):
+            out[key] = encode_form(v, fallback, pos)
+        else:
+            i = pos[0]
+            out[key] = encode_tag(v, lambda tag: fallback(tag, i))
+            pos[0] += 1
+    return out
+
+
+def fingerprint(form: dict) -> int | None:
+    """Structural fingerprint of an encoded form.
+
+    Two forms with the same fingerprint differ in their values only: they have the
+    same keys and, tag by tag, the same kind, label, description, annotation,
+    options, mnemonic, error text, callbacks and value type. A child may then
+    re-bind the values into the widgets it shows instead of rebuilding them.
+    None if a tag travels as a fallback Tag (its structure is not known here)."""
+    parts = []
+    for key, v in form.items():
+        if isinstance(v, dict):
+            if (sub := fingerprint(v)) is None:
+                return None
+            parts.append((key, sub))
+        elif isinstance(v, TagWire):
+            parts.append((key, v.kind, v.label, v.description, repr(v.annotation), v.options, v.mnemonic,
+                          v.error_text, v.flags, repr(v.extra), type(v.val).__name__))
+        else:
+            return None
+    try:
+        return hash(tuple(parts))
+    except TypeError:  # unhashable options or a mnemonic
+        return None
+
+
+def form_values(form: dict) -> list:
+    """The values of an encoded form, in the flatten order.
+
+    Sent in a FORM_VALUES message instead of the form whose fingerprint the child has already got."""
+    return [w.val for w in flatten(form)]
+
+
+def with_values(form: dict, values: list) -> dict:
+    """Child side: the form of the previous FORM message, with the values of a FORM_VALUES message."""
+    for w, val in zip(flatten(form), values):
+        w.val = val
+    return form
+
+
+def decode_tag(wire: TagWire, pos: int) -> "Tag":
+    """Child side: rebuild a Tag from its TagWire.
+
+    Like unpickling, the instance is restored without running __post_init__ —
+    the parent already determined the annotation, the multiple flag etc."""
+    from .subprocess_base import _stripped_callback
+    from .subprocess_child_base import _OnChangeProxy, _ValidationProxy
+
+    cls = _kinds()[wire.kind]
+    tag = cls.__new__(cls)
+    state = dict(wire.extra)
+    val = wire.val
+    if wire.options is not None:
+        labels = wire.options
+        state["options"] = {label: label for label in labels}
+        if "tips" in state:
+            state["tips"] = [labels[i] for i in state["tips"]]
+        val = [labels[i] for i in val] if isinstance(val, list) else (None if val is None else labels[val])
+    elif wire.flags & BUTTON:
+        val = _stripped_callback
+    state.update(
+        val=val,
+        _original_val=val,
+        description=wire.description,
+        _original_desc=wire.description,
+        label=wire.label,
+        _original_label=wire.label,
+        annotation=wire.annotation,
+        mnemonic=wire.mnemonic,
+        on_change=_OnChangeProxy(pos) if wire.flags & ON_CHANGE else None,
+        validation=_ValidationProxy(pos) if wire.flags & VALIDATION else None,
+        _last_ui_val=None,
+    )
+    tag.__dict__.update(state)
+    if wire.error_text is not None:
+        tag.set_error_text(wire.error_text)
+    return tag
+
+
+def decode_form(form: dict, _pos: list | None = None) -> "TagDict":
+    """Child side: turn an encoded form back to a TagDict. Fallback tags pass through as they are."""
+    pos = _pos if _pos is not None else [0]
+    out = {}
+    for key, v in form.items():
+        if isinstance(v, dict):
+            out[key] = decode_form(v, pos)
+        else:
+            out[key] = decode_tag(v, pos[0]) if isinstance(v, TagWire) else v
+            pos[0] += 1
+    return out
@@ -13,8 +13,10 @@ from ..tag.tag import Tag, TagValue, ValidationCallback
 from .adaptor import BackendAdaptor, MinAdaptor
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from typing import Self
     from .._lib.form_dict import FormDict
+    from .._lib.form_template import FormTemplate
 else:
     FormDict = dict  # runtime alias; real type under TYPE_CHECKING only
 
@@ -544,6 +546,112 @@ class Mininterface(Generic[EnvClass]):
         print(f"Asking the form {title}".strip(), f)
         return self._form(form, title, self._adaptor, submit)
 
+    async def aform(
+        self, form: DataClass | Type[DataClass] | FormDict | None = None, title: str = "", *, submit: str | bool = True
+    ) -> FormDict | DataClass | EnvClass:
+        """The [`form`][mininterface.Mininterface.form] for asyncio programs.
+
+        The event loop keeps running while the dialog is open, so other tasks do not stall.
+
+        ```python
+        import asyncio
+        from mininterface import run
+
+        async def main():
+            m = run(interface="gui")
+            out = await m.aform({"My number": 1})
+
+        asyncio.run(main())
+        ```
+
+        The `on_change` and `validation` callbacks run on the event loop.
+        """
+        return await self._adaptor._arun(self.form, form, title, submit=submit)
+
+    async def aask(
+        self,
+        text: str,
+        annotation: Type[TagValue] | Tag[TagValue] = str,
+        validation: Iterable[ValidationCallback] | ValidationCallback | None = None,
+    ) -> TagValue:
+        """The [`ask`][mininterface.Mininterface.ask] for asyncio programs, see [`aform`][mininterface.Mininterface.aform]."""
+        return await self._adaptor._arun(self.ask, text, annotation, validation)
+
+    async def aconfirm(self, text: str, default: bool = True, *, timeout: int = 0) -> bool:
+        """The [`confirm`][mininterface.Mininterface.confirm] for asyncio programs, see [`aform`][mininterface.Mininterface.aform]."""
+        return await self._adaptor._arun(self.confirm, text, default, timeout=timeout)
+
+    async def aselect(
+        self,
+        options: OptionsType[TagValue],
+        title: str = "",
+        default: TagValue | OptionsType[TagValue] | None = None,
+        tips: OptionsType[TagValue] | None = None,
+        multiple: Optional[bool] = None,
+        skippable: bool = True,
+        launch: bool = True,
+    ) -> TagValue | list[TagValue] | Any:
+        """The [`select`][mininterface.Mininterface.select] for asyncio programs, see [`aform`][mininterface.Mininterface.aform]."""
+        return await self._adaptor._arun(self.select, options, title, default, tips, multiple, skippable, launch)
+
+    def submit(self, method: Callable[..., TagValue], /, *args, priority: int = 0, **kwargs) -> "Future[TagValue]":
+        """Queue a dialog to be shown when the UI is free. Returns a `concurrent.futures.Future` at once.
+
+        The dialogs requested from multiple threads are shown one at a time.
+        (Calling the dialog methods directly from threads is safe too, they just block until their turn.)
+
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+        from mininterface import run
+
+        m = run()
+
+        def job(i):
+            ...
+            if m.submit(m.confirm, f"Job {i} failed. Retry?", priority=1).result():
+                ...
+
+        with ThreadPoolExecutor() as pool:
+            pool.map(job, range(10))
+        ```
+
+        Args:
+            method: The dialog method, ex. `m.confirm`, and its parameters.
+            priority: The waiting dialogs with a higher priority are shown first.
+        """
+        return self._adaptor._dialogs.submit(method, *args, priority=priority, **kwargs)
+
+    def template(
+        self, form: Type[DataClass] | DataClass | FormDict, title: str = "", *, submit: str | bool = True
+    ) -> "FormTemplate":
+        """Prepare a form to be shown many times, with different values.
+
+        The form is analysed once (the field types, the mnemonics). A UI running in a separate
+        process receives only the values when it shows the same form again.
+
+        ```python
+        from mininterface import run
+
+        m = run()
+        review = m.template({"name": "", "approved": False}, "Review")
+        for record in records:
+            out = review.show({"name": record.name})
+            record.approved = out["approved"]
+        ```
+
+        Args:
+            form: A dict, a dataclass instance or a dataclass type, as in [`form`][mininterface.Mininterface.form].
+                A dataclass type is instantiated once, each `show` then returns that instance.
+            title: The form title.
+            submit: Set the submit button text (by default 'Ok') or hide it with False.
+
+        Returns:
+            An object whose `show(values=None, title=None)` fills the values in and prompts
+            the user like [`form`][mininterface.Mininterface.form]. The values not given stay as they are.
+        """
+        from .._lib.form_template import FormTemplate
+        return FormTemplate(self, form, title, submit)
+
     def _form(
         self,
         form: DataClass | Type[DataClass] | FormDict | None,
@@ -552,7 +660,10 @@ class Mininterface(Generic[EnvClass]):
         submit: str | bool = True,
     ) -> FormDict | DataClass | EnvClass:
         from .._lib.form_dict import dataclass_to_tagdict, dict_to_tagdict, tagdict_resolve
+        from .._lib.form_template import FormTemplate
         _form = self.env if form is None else form
+        if isinstance(_form, FormTemplate):
+            return _form._run(adaptor, title, submit)
         if isinstance(_form, dict):
             return tagdict_resolve(
                 adaptor.run_dialog(dict_to_tagdict(_form, self), title=title, submit=submit), extract_main=True
@@ -1,9 +1,12 @@
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from itertools import chain
 from string import ascii_lowercase
 from typing import TYPE_CHECKING, Callable, Optional
 
 from .._lib.auxiliary import flatten
+from .._lib.dialog_scheduler import DialogScheduler
 from ..exceptions import Cancelled, ValidationFail
 from ..facet import Facet
 from ..settings import UiSettings
@@ -25,9 +28,13 @@ class BackendAdaptor(ABC):
     post_submit_action: Optional[Callable] = None
     interface: "Mininterface"
     settings: UiSettings
+    _mnemonics_of: Optional[TagDict] = None
+    """ The form whose mnemonics were determined last. A form shown repeatedly (see Mininterface.template) keeps them. """
 
     def __init__(self, interface: "Mininterface", settings: UiSettings | None):
         self.interface = interface
+        self._dialogs = DialogScheduler()
+        """ Serves the dialogs requested from multiple threads one at a time. """
 
         # Why looping mro? Since 3.14, ex. MockAdaptor does not inherit .facet annotation from MinAdaptor.
         for cl in type(self).__mro__:
@@ -47,8 +54,9 @@ class BackendAdaptor(ABC):
     def _setup_form_facet(self, form: TagDict) -> None:
         """Setup form facet: fetch from adaptor, determine mnemonics."""
         self.facet._fetch_from_adaptor(form)
-        if self.settings.mnemonic is not False:
+        if self.settings.mnemonic is not False and form is not self._mnemonics_of:
             self._determine_mnemonic(form, self.settings.mnemonic is True)
+            self._mnemonics_of = form
 
     @abstractmethod
     def run_dialog(self, form: TagDict, title: str = "", submit: bool | str = True) -> None:
@@ -58,6 +66,13 @@ class BackendAdaptor(ABC):
         """
         self._setup_form_facet(form)
 
+    async def _arun(self, method: Callable, *args, **kwargs):
+        """Await a blocking dialog method (Mininterface.form, ...) without blocking the event loop.
+
+        Here, the method runs in a worker thread. The subprocess adaptors
+        further wait for their child on the loop itself."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(method, *args, **kwargs))
+
     def _determine_mnemonic(self, form: TagDict, also_nones=False):
         """also_nones – Also determine those tags when Tag.mnemonic=None."""
         # Determine mnemonic
@@ -17,6 +17,7 @@ from ..settings import TextSettings
 from ..tag.internal import BoolWidget, CallbackButtonWidget, SubmitButtonWidget
 from ..tag.secret_tag import SecretTag
 from ..tag.select_tag import SelectTag
+from ..tag.table_tag import CellEdits, TableTag
 from .facet import TextFacet
 from .timeout import input_timeout
 
@@ -64,6 +65,8 @@ class TextAdaptor(BackendAdaptor):
             case SecretTag():
                 # NOTE the input should be masked (according to tag._masked)
                 return tag._get_masked_val() if only_label else self.interface.ask(label)
+            case TableTag():
+                return f"({len(v)} rows)" if only_label else self._edit_table(tag)
             case _:
                 match tag._recommend_widget():
                     case BoolWidget():
@@ -87,6 +90,37 @@ class TextAdaptor(BackendAdaptor):
                         else:
                             return self.interface.ask(label, tag.annotation)
 
+    def _edit_table(self, tag: TableTag) -> CellEdits:
+        """Page through the rows, choose a row and its cell to edit it. Ok returns the edited cells."""
+        rows = tag._get_ui_val()
+        edits = CellEdits()
+        size = max(1, tag.page_size)
+        start = 0
+
+        def cells(row: int) -> list[str]:
+            shown = (edits.cells.get((row, c), cell) for c, cell in enumerate(rows[row]))
+            return [f"{col}: {cell}" for col, cell in zip(tag.columns, shown)]
+
+        while True:
+            page = range(start, min(start + size, len(rows)))
+            more, back = page.stop < len(rows), start > 0
+            items = [f"{r + 1}. " + ", ".join(cells(r)) for r in page]
+            items += ["next page →"] * more + ["← previous page"] * back
+            try:
+                title = f"{tag.label} ({page.start + 1}–{page.stop} of {len(rows)})"
+                i = self._choose(items, title=title, append_ok=True)
+            except Submit:
+                return edits
+            if i >= len(page):  # navigation
+                start += size if more and i == len(page) else -size
+                continue
+            row = page[i]
+            try:
+                c = self._choose(cells(row), title=f"Row {row + 1}", append_ok=True)
+            except Submit:
+                continue
+            edits.cells[(row, c)] = self.interface.ask(f"{tag.columns[c]}:")
+
     def _get_tag_val(self, val: Tag | dict):
         match val:
             case Tag() as tag:
@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .._lib.auxiliary import naturalsize  # light-weight humanize clone
-from ..facet import Facet, Image, LayoutElement
+from ..facet import Facet, Image, LayoutElement, Progress
 
 if TYPE_CHECKING:
     from .adaptor import TextAdaptor
@@ -28,3 +28,7 @@ class TextFacet(Facet):
                     print(el)
                 case _:
                     print("Error in the layout: Unknown {el}")
+
+    def _show_progress(self, progress: Progress):
+        # Redraw the same line, the final state stays.
+        print(f"\r{progress}", end="\n" if progress.closed else "", flush=True)
@@ -5,6 +5,7 @@ from textual.widgets import Label, Rule
 from ..tag.path_tag import PathTag
 
 from ..tag.select_tag import SelectTag
+from ..tag.table_tag import TableTag
 
 from .button_contents import ButtonAppType
 
@@ -20,6 +21,8 @@ from ..tag.secret_tag import SecretTag
 from ..tag.internal import BoolWidget, CallbackButtonWidget, SubmitButtonWidget
 from .facet import TextualFacet
 from .file_picker_input import FilePickerInputFactory
+from .table_input import TableInput
+from .form_contents import get_ui_values
 from .textual_app import TextualApp
 from .widgets import (
     TagWidget,
@@ -70,6 +73,8 @@ class TextualAdaptor(BackendAdaptor):
                 o = FilePickerInputFactory(self, tag, placeholder=tag.label or "")
             case SecretTag():
                 o = SecretInputFactory(self, tag, placeholder=tag.label or "", type="text")
+            case TableTag():
+                o = TableInput(tag)
             case _:
                 match tag._recommend_widget():
                     case BoolWidget():
@@ -152,7 +157,7 @@ class TextualAdaptor(BackendAdaptor):
                     continue
                 return form
 
-            ui_vals = [f.get_ui_value() for f in app.widgets if isinstance(f, TagWidget)]
+            ui_vals = get_ui_values(self.facet._form or {}, app.widgets)
             if self._try_submit(zip(flatten(self.facet._form or {}), ui_vals)):
                 return form
 
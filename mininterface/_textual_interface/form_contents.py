@@ -1,13 +1,16 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 from .._lib.auxiliary import flatten
-from .._lib.form_dict import tagdict_to_widgetdict
+from .._lib.form_dict import TagDict, tagdict_to_widgetdict
+from ..tag.select_tag import SelectTag
 from .widgets import TagWidget
 
 
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
-from textual.widgets import Checkbox, Footer, Header, Input, Label, RadioSet, Rule, SelectionList, Static
+from textual.widget import Widget
+from textual.widgets import Checkbox, Collapsible, Footer, Header, Input, Label, RadioSet, Rule, SelectionList, Static
+from textual.widgets._collapsible import CollapsibleTitle
 
 if TYPE_CHECKING:
     from .adaptor import TextualAdaptor
@@ -34,12 +37,20 @@ class FormContents(Static):
         # since textual 1.0.0 we have to build widgets not earlier than the context app is ready
 
         self.widgets.clear()
-        self.widgets.extend(
-            flatten(
-                tagdict_to_widgetdict(self.adaptor.facet._form, self.adaptor.widgetize),
-                include_keys=self.adaptor.header,
+        form = self.adaptor.facet._form
+        since = getattr(self.adaptor.settings, "lazy_sections_since", None)
+        if since is not None and any(isinstance(v, dict) for v in form.values()) and len(list(flatten(form))) >= since:
+            # Only the top-level fields are widgetized now, the sections on their expansion.
+            elements = list(self._section_elements(form))
+            self.widgets.extend(w for w in elements if not isinstance(w, _LazySection))
+        else:
+            elements = None
+            self.widgets.extend(
+                flatten(
+                    tagdict_to_widgetdict(form, self.adaptor.widgetize),
+                    include_keys=self.adaptor.header,
+                )
             )
-        )
 
         # there are multiple sections in the list, <hr>ed by Rule elements. However, the first takes much space.
         if len(self.widgets) and isinstance(self.widgets[0], Rule):
@@ -53,25 +64,59 @@ class FormContents(Static):
 
         with VerticalScroll():
             yield from self.adaptor.layout_elements
-            for i, fieldt in enumerate(self.widgets):
-                if isinstance(fieldt, Input):
-                    yield Label(fieldt.placeholder, markup=False)
-                    fieldt.placeholder = ""
-                # NOTE MyRadioSet not shown now: add name in widgetize and display here
-                # NOTE: has this something to do with the PathTag?
-                elif hasattr(fieldt, "tag") and fieldt.tag.label and not isinstance(fieldt, Input):
-                    yield Label(fieldt.tag.label, markup=False)
-                yield fieldt
-                if isinstance(fieldt, TagWidget) and (arb := fieldt._arbitrary):
-                    yield arb
-                if isinstance(fieldt, TagWidget) and (desc := fieldt.tag.description):
-                    yield Label(desc, markup=False)
-                yield Label("")
+            yield from self._field_elements(self.widgets if elements is None else elements)
         self.focusable_.clear()
         self.focusable_.extend(w for w in self.widgets if isinstance(w, (Input, TagWidget)))
 
+    def _section_elements(self, section: TagDict) -> Iterable[Widget]:
+        """Widgetize the fields of the section, its subsections become _LazySection placeholders."""
+        for key, v in section.items():
+            if isinstance(v, dict):
+                yield _LazySection(self, key, v)
+            else:
+                yield tagdict_to_widgetdict(v, self.adaptor.widgetize, key)
+
+    def _field_elements(self, widgets: Iterable[Widget]) -> Iterable[Widget]:
+        """The widgets together with their labels and descriptions, as laid out in the form."""
+        for fieldt in widgets:
+            if isinstance(fieldt, _LazySection):
+                yield fieldt
+                continue
+            if isinstance(fieldt, Input):
+                yield Label(fieldt.placeholder, markup=False)
+                fieldt.placeholder = ""
+            # NOTE MyRadioSet not shown now: add name in widgetize and display here
+            # NOTE: has this something to do with the PathTag?
+            elif hasattr(fieldt, "tag") and fieldt.tag.label and not isinstance(fieldt, Input):
+                yield Label(fieldt.tag.label, markup=False)
+            yield fieldt
+            if isinstance(fieldt, TagWidget) and (arb := fieldt._arbitrary):
+                yield arb
+            if isinstance(fieldt, TagWidget) and (desc := fieldt.tag.description):
+                yield Label(desc, markup=False)
+            yield Label("")
+
+    async def _expand(self, section: "_LazySection"):
+        """Widgetize the section contents and put them into the focus order."""
+        elements = list(self._section_elements(section.tags))
+        await section.query_one(Collapsible.Contents).mount_all(list(self._field_elements(elements)))
+        self.widgets.extend(w for w in elements if not isinstance(w, _LazySection))
+        self._sort_focus()
+
+    def _sort_focus(self):
+        """Order the widgets as shown. Section titles are focusable too, to be expanded by Enter."""
+        order = {w: i for i, w in enumerate(self.query("*"))}
+        self.widgets.sort(key=lambda w: order.get(w, -1))
+        fields = {w for w in self.widgets if isinstance(w, (Input, TagWidget))}
+        self.focusable_[:] = (w for w in order if w in fields or isinstance(w, CollapsibleTitle))
+
     def on_mount(self):
-        self.widgets[self.focused_i].focus()
+        if self.query(_LazySection):
+            self._sort_focus()
+        if self.widgets:
+            self.widgets[self.focused_i].focus()
+        elif self.focusable_:
+            self.focusable_[0].focus()
 
     def on_key(self, event: events.Key) -> None:
         f = self.focusable_
@@ -98,7 +143,7 @@ class FormContents(Static):
             case "enter":
                 # NOTE a multiline input might be
                 # isinstance(self.focused,
-                if self.app.submit:
+                if self.app.submit and not isinstance(ff, CollapsibleTitle):
                     self.app.action_confirm()
                     event.stop()
             case letter if len(letter) == 1:  # navigate by letters
@@ -113,3 +158,32 @@ class FormContents(Static):
                     if str(label).casefold().startswith(letter):
                         inp_.focus()
                         break
+
+
+class _LazySection(Collapsible):
+    """A collapsed form section. Its fields are widgetized on the first expansion."""
+
+    def __init__(self, contents: FormContents, key: str, tags: TagDict):
+        super().__init__(title=str(key), collapsed=True)
+        self.contents = contents
+        self.tags = tags
+        self.rendered = False
+
+    async def on_collapsible_expanded(self, event: Collapsible.Expanded):
+        if event.collapsible is not self or self.rendered:
+            return
+        self.rendered = True
+        await self.contents._expand(self)
+
+
+def get_ui_values(form: TagDict, widgets: Iterable[Widget]) -> list:
+    """The UI values in the order of flatten(form).
+
+    A tag that has no widget (a never expanded section) gives its current value,
+    as its widget would have: options and buttons hold the value itself."""
+    ui = {id(w.tag): w.get_ui_value() for w in widgets if isinstance(w, TagWidget)}
+
+    def unrendered(tag):
+        return tag.val if isinstance(tag, SelectTag) or tag._is_a_callable() else tag._get_ui_val()
+
+    return [ui[id(tag)] if id(tag) in ui else unrendered(tag) for tag in flatten(form)]
@@ -29,6 +29,12 @@ class _SubprocessFacet(TextualFacet):
         super()._clear()
         self.adaptor._clear_output()  # also empty the child's on-screen output
 
+    def _show_progress(self, progress):
+        self.adaptor._send_progress(progress)  # the child draws the bar
+
+    def _push(self, tags):
+        self.adaptor._push_values(tags)
+
 
 class TextualSubprocessAdaptor(SubprocessAdaptorBase, TextualAdaptor):
     """Parent-side adaptor. Communicates with a persistent Textual subprocess."""
@@ -11,6 +11,8 @@ on_change callbacks: _OnChangeProxy replaces tag.on_change.  When fired
 the parent — brief, but acceptable since the handlers are not `async def`.
 If an OUTPUT message arrives while waiting for FORM_UPDATE, it is routed to
 the RichLog and the read loop continues until FORM_UPDATE is found.
+With ``live_callback_delay`` set, the proxy returns at once and the IPC worker,
+waiting for the submit, reads the reply instead (``wait_submitted``).
 
 button callbacks: MyButton.on_button_pressed → facet.submit(_post_submit=callable)
 sets adaptor.post_submit_action before action_confirm().  After _submitted is set we
@@ -29,7 +31,8 @@ from typing import TYPE_CHECKING
 
 from .._lib.ipc_command import IpcCommand
 from .._lib.subprocess_child_base import (error_payload, read_msg as _read_msg,
-                                          send_msg as _send_msg, register_hooks, set_proxies_active)
+                                          send_msg as _send_msg, register_hooks, set_proxies_active,
+                                          wait_submitted)
 
 if TYPE_CHECKING:
     from .adaptor import TextualAdaptor
@@ -42,6 +45,7 @@ if TYPE_CHECKING:
 def _apply_form_update(updates: list, title: str, adaptor: "TextualAdaptor") -> None:
     """Apply (pos, new_val) pairs to the child's tag copies and refresh widgets."""
     from .._lib.auxiliary import flatten
+    from .table_input import TableInput
     from .widgets import MyCheckbox, MyInput, TagWidget
 
     if title:
@@ -50,7 +54,8 @@ def _apply_form_update(updates: list, title: str, adaptor: "TextualAdaptor") ->
             adaptor.app.title = title
 
     tags = list(flatten(adaptor.facet._form))  # type: ignore[arg-type]
-    tag_widgets = [w for w in adaptor.app.widgets if isinstance(w, TagWidget)] if adaptor.app else []
+    # A tag in a never expanded section has no widget (see TextualSettings.lazy_sections_since).
+    tag_widgets = {id(w.tag): w for w in adaptor.app.widgets if isinstance(w, TagWidget)} if adaptor.app else {}
 
     for pos, new_val in updates:
         if not (0 <= pos < len(tags)):
@@ -59,12 +64,13 @@ def _apply_form_update(updates: list, title: str, adaptor: "TextualAdaptor") ->
         tags[pos]._last_ui_val = new_val  # prevent re-triggering on the same value
 
         # Best-effort visual refresh
-        if pos < len(tag_widgets):
-            w = tag_widgets[pos]
+        if w := tag_widgets.get(id(tags[pos])):
             if isinstance(w, MyInput):
                 w.value = str(new_val)
             elif isinstance(w, MyCheckbox):
                 w.value = bool(new_val)
+            elif isinstance(w, TableInput):
+                w.set_rows(new_val)
 
 
 # ---------------------------------------------------------------------------
@@ -78,13 +84,13 @@ class PersistentChildApp:
 def _make_persistent_child_app_class():
     """Return PersistentChildApp (deferred import to avoid loading Textual at module level)."""
     from textual.app import App
-    from textual.containers import Container
-    from textual.widgets import Footer, RichLog
+    from textual.containers import Container, Horizontal
+    from textual.widgets import Footer, Label, ProgressBar, RichLog
 
     from .._lib.auxiliary import flatten
     from ..exceptions import Cancelled
     from .button_contents import ButtonContents
-    from .form_contents import FormContents
+    from .form_contents import FormContents, get_ui_values
     from .timeout import TextualTimeout
     from .widgets import TagWidget
 
@@ -116,10 +122,13 @@ def _make_persistent_child_app_class():
             """ True once the session is genuinely ending (SHUTDOWN / EOF). A plain Esc
                 cancel does NOT set this: the form is cleared but the persistent app
                 stays alive for the next dialog, exactly like a submit. """
+            self._progress_bars: dict[int, tuple[Horizontal, ProgressBar]] = {}
+            """ The shown facet.progress bars (a row with the description and the bar) by their key. """
 
         def compose(self):
-            # Form on top, output log below it, control bar docked at screen bottom.
+            # Form on top, progress bars and output log below it, control bar docked at screen bottom.
             yield Container(id="form-container")
+            yield Container(id="progress")
             yield RichLog(id="output-log", auto_scroll=True, markup=False, highlight=False)
             yield Footer()
 
@@ -145,6 +154,32 @@ def _make_persistent_child_app_class():
             except Exception:
                 pass
 
+        def _show_progress(self, key: int, n: float, total: float | None, description: str, closed: bool) -> None:
+            """Draw, move or remove a facet.progress bar. Main-thread safe."""
+            try:
+                if closed:
+                    if shown := self._progress_bars.pop(key, None):
+                        shown[0].remove()
+                    return
+                if key not in self._progress_bars:
+                    bar = ProgressBar(show_eta=False)
+                    row = Horizontal(Label(description), bar)
+                    self._progress_bars[key] = row, bar
+                    self.query_one("#progress", Container).mount(row)
+                self._progress_bars[key][1].update(total=total, progress=n)
+            except Exception:
+                pass
+
+        def _editing_pos(self) -> int | None:
+            """The position of the field the user is editing (having the focus). Pushed values skip it."""
+            widget = self.focused
+            while widget is not None and not isinstance(widget, TagWidget):
+                widget = widget.parent
+            if widget is None:
+                return None
+            tags = flatten(self.adaptor.facet._form or {})
+            return next((pos for pos, tag in enumerate(tags) if tag is widget.tag), None)
+
         # ------------------------------------------------------------------ IPC
 
         def _safe_exit(self):
@@ -188,7 +223,7 @@ def _make_persistent_child_app_class():
             except Exception as exc:
                 self._result = self._refresh_failure(exc)
                 self._submitted.set()
-            self._submitted.wait()
+            wait_submitted(self._submitted)
             _send_msg(write_fd, self._result)
             if self._closing:
                 self._safe_exit()
@@ -226,7 +261,7 @@ def _make_persistent_child_app_class():
             except Exception as exc:
                 self._result = self._refresh_failure(exc)
                 self._submitted.set()
-            self._submitted.wait()
+            wait_submitted(self._submitted)
             _send_msg(write_fd, self._result)
             if self._closing:
                 self._safe_exit()
@@ -238,6 +273,7 @@ def _make_persistent_child_app_class():
             handlers = {
                 'OUTPUT': lambda text: self.call_from_thread(self._append_output, text),
                 'CLEAR_OUTPUT': lambda: self.call_from_thread(self._clear_output),
+                'PROGRESS': lambda *args: self.call_from_thread(self._show_progress, *args),
                 # The user's settings arrive before the first form; apply them to
                 # the adaptor (created with defaults) so widget building matches.
                 'SETTINGS': lambda settings: setattr(self.adaptor, 'settings', settings),
@@ -333,10 +369,10 @@ def _make_persistent_child_app_class():
                 )
                 # Send the current field values too: a button is a submit, so the
                 # parent validates the whole form before running the callable.
-                ui_vals = [w.get_ui_value() for w in self.widgets if isinstance(w, TagWidget)]
+                ui_vals = get_ui_values(self.adaptor.facet._form, self.widgets)
                 self._result = (IpcCommand.CALLBACK, "button", tag_pos, ui_vals)
             else:
-                ui_vals = [w.get_ui_value() for w in self.widgets if isinstance(w, TagWidget)]
+                ui_vals = get_ui_values(self.adaptor.facet._form, self.widgets)
                 self._result = (IpcCommand.RESULT, ui_vals)
             self._submitted.set()
 
@@ -377,5 +413,8 @@ def run_child_main(read_fd: int, write_fd: int) -> None:
         apply_form_update=lambda updates, title: _apply_form_update(updates, title, adaptor),
         append_output=lambda text: app._append_output(text),
         shutdown=app._safe_exit,
+        call_in_ui=app.call_from_thread,
+        show_progress=lambda *args: app._show_progress(*args),
+        editing=lambda: app._editing_pos(),
     )
     app.run()
@@ -0,0 +1,97 @@
+from textual import events
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.coordinate import Coordinate
+from textual.widgets import DataTable, Input
+
+from ..tag.table_tag import Cell, CellEdits, TableTag
+from .widgets import TagWidget
+
+
+class TableInput(TagWidget, Vertical):
+    """An editable grid of a TableTag.
+
+    Enter edits the cell under the cursor in an input below the grid,
+    Enter confirms the edit, Escape reverts it.
+    The DataTable draws the visible rows only, so a long table costs little.
+    """
+
+    DEFAULT_CSS = """
+    TableInput {
+        height: auto;
+    }
+
+    TableInput DataTable {
+        height: auto;
+        max-height: 16;
+    }
+
+    TableInput Input {
+        display: none;
+    }
+
+    TableInput Input.editing {
+        display: block;
+    }
+    """
+
+    tag: TableTag
+
+    def __init__(self, tag: TableTag):
+        super().__init__(tag)
+        self.rows: list[list[Cell]] = tag._get_ui_val()
+        self.cells: dict[tuple[int, int], Cell] = {}
+        """ The edited cells """
+        self.table = DataTable(cursor_type="cell", zebra_stripes=True)
+        self.editor = Input()
+        self._editing: tuple[int, int] | None = None
+
+    def compose(self) -> ComposeResult:
+        yield self.table
+        yield self.editor
+
+    def on_mount(self):
+        self.table.add_columns(*self.tag.columns)
+        self.set_rows(self.rows)
+
+    def set_rows(self, rows: list[list[Cell]]):
+        """Show new rows, forgetting the edits."""
+        self.rows = rows
+        self.cells.clear()
+        self.table.clear()
+        self.table.add_rows(rows)
+
+    def focus(self, scroll_visible: bool = True):
+        """Focus the grid."""
+        return self.table.focus(scroll_visible)
+
+    def on_data_table_cell_selected(self, event: DataTable.CellSelected):
+        event.stop()
+        row, col = event.coordinate
+        self._editing = row, col
+        self.editor.value = str(self.cells.get((row, col), self.rows[row][col]))
+        self.editor.add_class("editing")
+        self.editor.focus()
+
+    def on_input_submitted(self, event: Input.Submitted):
+        event.stop()
+        if self._editing is None:
+            return
+        row, col = self._editing
+        self.cells[(row, col)] = event.value
+        self.table.update_cell_at(Coordinate(row, col), event.value)
+        self._stop_editing()
+        self.trigger_change()
+
+    def on_key(self, event: events.Key):
+        if event.key == "escape" and self._editing is not None:
+            event.stop()
+            self._stop_editing()
+
+    def _stop_editing(self):
+        self._editing = None
+        self.editor.remove_class("editing")
+        self.table.focus()
+
+    def get_ui_value(self) -> CellEdits:
+        return CellEdits(dict(self.cells))
@@ -103,6 +103,11 @@ class TkAdaptor(Tk, RichUiAdaptor, BackendAdaptor):
 
     def widgetize(self, tag: Tag) -> Value:
         """Wrap Tag to a textual widget."""
+        return Value(self._ui_value(tag), tag.description)
+
+    @staticmethod
+    def _ui_value(tag: Tag) -> float | int | str | bool:
+        """The tag value as put into its tkinter variable."""
         v = tag._get_ui_val()
         if tag.annotation is bool and not isinstance(v, bool):
             # tkinter_form unfortunately needs the bool type to display correct widget,
@@ -110,7 +115,7 @@ class TkAdaptor(Tk, RichUiAdaptor, BackendAdaptor):
             v = bool(v)
         elif not isinstance(v, (float, int, str, bool)):
             v = str(v)
-        return Value(v, tag.description)
+        return v
 
     def _build_form(self, form: TagDict, title: str = "", submit: bool | str = True) -> None:
         """Build the Tk widgets for the form (no mainloop).
@@ -39,6 +39,12 @@ class _SubprocessTkFacet(Facet):
         super()._clear()
         self.adaptor._clear_output()  # also empty the child's on-screen output
 
+    def _show_progress(self, progress):
+        self.adaptor._send_progress(progress)  # the child draws the bar
+
+    def _push(self, tags):
+        self.adaptor._push_values(tags)
+
     # submit() is inherited from Facet — it only records post_submit_action,
     # which the IPC callback channel turns into a CALLBACK("button").
 
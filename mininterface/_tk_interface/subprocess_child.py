@@ -20,7 +20,8 @@ on_change: the parent replaces ``tag.on_change`` with the shared
 ``_OnChangeProxy``.  When fired (synchronously, in a Tk event callback on the
 main thread) it does a brief blocking round-trip with the parent.  The IPC
 worker is parked in ``_submitted.wait()`` meanwhile, so it is the only reader of
-the pipe — no contention.
+the pipe — no contention.  With ``live_callback_delay`` set, the proxy returns at
+once and the parked worker reads the reply instead (``wait_submitted``).
 
 button: a callback button calls ``facet.submit`` → ``adaptor._ok`` which detects
 ``post_submit_action`` and reports a CALLBACK("button") to the parent.
@@ -32,16 +33,20 @@ import threading
 import tkinter
 
 from .._lib.auxiliary import flatten
-from .._lib.subprocess_child_base import error_payload, read_msg, send_msg, register_hooks
+from .._lib.subprocess_child_base import error_payload, read_msg, send_msg, register_hooks, wait_submitted
 from .._lib.ipc_command import IpcCommand
 from ..exceptions import Cancelled
 
 
 def _make_child_adaptor_class():
     """Return _ChildTkAdaptor (deferred import to keep tkinter_form out of module load)."""
-    from tkinter import END
+    from tkinter import END, Frame, Label
+    from tkinter.ttk import Progressbar
     from .adaptor import TkAdaptor
-    from .utils import widgets_to_dict
+    from ..tag.select_tag import SelectTag
+    from ..tag.table_tag import TableTag
+    from .select_input import VariableAnyWrapper
+    from .utils import AnyVariable, recursive_set_focus, widgets_to_dict
 
     class _ChildTkAdaptor(TkAdaptor):
         """Persistent Tk adaptor living in the child process.
@@ -64,6 +69,13 @@ def _make_child_adaptor_class():
                 persistent app stays alive for the next dialog, exactly like a submit. """
             self._button_mode = False
             self._always_shown = False
+            self._kept_form: tuple | None = None
+            """ ((fingerprint, submit), form) of self.form if its widgets are kept
+                for the next form of the same structure (see _rebind_form). """
+            self._progress_bars: dict[int, tuple[Frame, Progressbar]] = {}
+            """ The shown facet.progress bars (a frame with the description and the bar) by their key. """
+            self._shown_for_progress = False
+            """ The window was shown by a progress bar, not by a dialog. Hide it with the last bar. """
             self.protocol("WM_DELETE_WINDOW", self._on_close)
             # Read-only output: disabled state blocks editing but still allows
             # mouse selection + copy (Ctrl+C). Toggled to "normal" only for writes.
@@ -129,6 +141,38 @@ def _make_child_adaptor_class():
             except Exception:
                 pass
 
+        # -------------------------------------------------------------- progress
+
+        def _show_progress(self, key: int, n: float, total: float | None, description: str, closed: bool) -> None:
+            """Draw, move or remove a facet.progress bar. Below the form, above the output."""
+            try:
+                if closed:
+                    if shown := self._progress_bars.pop(key, None):
+                        shown[0].destroy()
+                        if not self._progress_bars and self._shown_for_progress:
+                            self._shown_for_progress = False
+                            self.withdraw()
+                    return
+                if key not in self._progress_bars:
+                    frame = Frame(self.frame)
+                    Label(frame, text=description).pack(side="left")
+                    bar = Progressbar(frame, length=300, mode="determinate" if total else "indeterminate")
+                    bar.pack(side="left", expand=True, fill="x", padx=5)
+                    frame.pack(side="bottom", fill="x", pady=2)
+                    self._progress_bars[key] = frame, bar
+                    if self.state() == "withdrawn":
+                        self._shown_for_progress = True
+                        self.deiconify()
+                    self.after(1, self._layout_new_dialog)
+                bar = self._progress_bars[key][1]
+                if total:
+                    bar.configure(maximum=total, value=n)
+                else:
+                    bar.step()  # an unknown total only shows the work goes on
+                self.update_idletasks()
+            except Exception:
+                pass
+
         # -------------------------------------------------------------- form update
 
         def _apply_form_update(self, updates: list, title: str) -> None:
@@ -155,6 +199,18 @@ def _make_child_adaptor_class():
                 # Update the in-window header, NOT the WM window title.
                 self.facet.set_title(title)
 
+        def _editing_pos(self) -> int | None:
+            """The position of the field the user is editing (having the focus). Pushed values skip it."""
+            try:
+                focused = str(self.focus_get())
+                for pos, field_form in enumerate(flatten(widgets_to_dict(self.form.fields))):
+                    widget = str(field_form.widget)
+                    if focused == widget or focused.startswith(widget + "."):
+                        return pos
+            except Exception:
+                pass
+            return None
+
         # -------------------------------------------------------------- submit / cancel
 
         def _clear_dialog(self):
@@ -162,10 +218,15 @@ def _make_child_adaptor_class():
 
             The base resets geometry to "" (fit content), which makes the window
             visibly shrink when a dialog disappears. Here we keep the current size
-            between dialogs — the next dialog calls _refresh_size to resize."""
+            between dialogs — the next dialog calls _refresh_size to resize.
+            The form widgets survive (hidden) when they may be reused."""
             self.frame.pack_forget()
+            keep = [self.text_widget, self.label_frame, self.label, *(f for f, _ in self._progress_bars.values())]
+            if self._kept_form:
+                self.form.pack_forget()
+                keep.append(self.form)
             for widget in self.frame.winfo_children():
-                if widget not in [self.text_widget, self.label_frame, self.label]:
+                if widget not in keep:
                     widget.destroy()
             for key in self._event_bindings:
                 self.unbind(key)
@@ -196,10 +257,45 @@ def _make_child_adaptor_class():
 
         # -------------------------------------------------------------- UI builders (main thread)
 
+        def _reuse_key(self, form, fingerprint, submit_flag) -> tuple | None:
+            """What must match for the form to reuse the kept widgets. None if it cannot."""
+            if fingerprint is None or any(
+                (isinstance(t, SelectTag) and t.multiple) or isinstance(t, TableTag) for t in flatten(form)
+            ):
+                # Widgets of a multiple choice (a checkbox per option) and of a table are not re-bindable.
+                return None
+            return fingerprint, submit_flag
+
+        def _rebind_form(self, form) -> None:
+            """Show the kept form widgets with the values of the form of the same structure.
+
+            The widget handlers hold the tags they were built for, so these tags take
+            over the state of the new ones and stay in the facet."""
+            shown = self._kept_form[1]
+            for old, new, field_form in zip(flatten(shown), flatten(form), flatten(widgets_to_dict(self.form.fields))):
+                label = old.label
+                old.__dict__.update(new.__dict__)
+                old.label = old.label or label  # the key, as given by tagdict_to_widgetdict
+                variable = field_form.variable
+                if isinstance(variable, VariableAnyWrapper):
+                    # Mark the value as seen first, setting a radio variable fires its on_change.
+                    key = old._get_selected_key() or ""
+                    old._last_ui_val = variable.mapping.get(key)
+                    variable.set(key)
+                elif not isinstance(variable, AnyVariable):  # AnyVariable holds a button
+                    variable.set(self._ui_value(old))
+                    old._last_ui_val = variable.get()
+            self.facet._fetch_from_adaptor(shown)
+            self.form.pack()
+            if self.form.button:
+                self._bind_event("<Return>", self._ok)
+            recursive_set_focus(self.form)
+
         def _show_form(self, form, title, submit_flag, raw_layout, redirected_text,
-                       always_shown, program_title=None):
+                       always_shown, program_title=None, fingerprint=None):
             try:
                 self._always_shown = always_shown
+                self._shown_for_progress = False  # the dialog owns the window now
                 if program_title:
                     self.title(program_title)  # WM window title = program name
                 self._button_mode = False
@@ -213,7 +309,18 @@ def _make_child_adaptor_class():
                 # run_dialog builds the form).
                 if raw_layout:
                     self.facet._layout(raw_layout)
-                self._build_form(form, title, submit_flag)
+                key = self._reuse_key(form, fingerprint, submit_flag)
+                if key is not None and self._kept_form and key == self._kept_form[0]:
+                    if title:
+                        self.facet.set_title(title)
+                    self._rebind_form(form)
+                else:
+                    if self._kept_form:
+                        self._kept_form = None
+                        self.form.destroy()
+                    self._build_form(form, title, submit_flag)
+                    if key is not None:
+                        self._kept_form = key, form
                 self.deiconify()
                 self.after(1, self._layout_new_dialog)
             except Exception as exc:
@@ -223,6 +330,7 @@ def _make_child_adaptor_class():
                           raw_layout=None, always_shown=False, program_title=None):
             try:
                 self._always_shown = always_shown
+                self._shown_for_progress = False  # the dialog owns the window now
                 if program_title:
                     self.title(program_title)  # WM window title = program name
                 self._button_mode = True
@@ -241,6 +349,7 @@ def _make_child_adaptor_class():
             """A dialog build crashed mid-way: remove whatever widgets it already
             packed (the parent may catch the error and open another dialog in this
             same live window), then unblock the worker with an ERROR result."""
+            self._kept_form = None
             try:
                 self._clear_dialog()
             except Exception:
@@ -261,7 +370,9 @@ def _make_child_adaptor_class():
             self.sf.scroll_to_top()
 
         def _after_submit(self):
-            if not self._always_shown:
+            if self._progress_bars:
+                self._shown_for_progress = not self._always_shown  # hidden with the last bar
+            elif not self._always_shown:
                 self.withdraw()
 
         # -------------------------------------------------------------- IPC worker (background thread)
@@ -269,10 +380,11 @@ def _make_child_adaptor_class():
         def _handle_form(self, write_fd, form, title, submit_flag, redirected_text, raw_layout, *rest):
             always_shown = rest[0] if rest else False
             program_title = rest[1] if len(rest) > 1 else None
+            fingerprint = rest[2] if len(rest) > 2 else None
             self._submitted.clear()
             self.after(0, self._show_form, form, title, submit_flag,
-                       raw_layout, redirected_text, always_shown, program_title)
-            self._submitted.wait()
+                       raw_layout, redirected_text, always_shown, program_title, fingerprint)
+            wait_submitted(self._submitted)
             send_msg(write_fd, self._ipc_result)
             if self._closing:
                 self.after(0, self.destroy)
@@ -289,7 +401,7 @@ def _make_child_adaptor_class():
             self._submitted.clear()
             self.after(0, self._show_buttons, text, buttons_list,
                        focused, timeout, redirected_text, raw_layout, always_shown, program_title)
-            self._submitted.wait()
+            wait_submitted(self._submitted)
             send_msg(write_fd, self._ipc_result)
             if self._closing:
                 self.after(0, self.destroy)
@@ -301,6 +413,7 @@ def _make_child_adaptor_class():
             handlers = {
                 'OUTPUT': lambda text: self.after(0, self._append_line, text),
                 'CLEAR_OUTPUT': lambda: self.after(0, self._clear_output),
+                'PROGRESS': lambda *args: self.after(0, self._show_progress, *args),
                 # The user's settings arrive before the first form; apply them to
                 # this adaptor (created with defaults) so widget building matches.
                 'SETTINGS': lambda settings: setattr(self, 'settings', settings),
@@ -344,6 +457,9 @@ def run_child_main(read_fd: int, write_fd: int) -> None:
         apply_form_update=adaptor._apply_form_update,
         append_output=adaptor._append_line,
         shutdown=lambda: adaptor.after(0, adaptor.destroy),
+        call_in_ui=lambda fn, *args: adaptor.after(0, fn, *args),
+        show_progress=adaptor._show_progress,
+        editing=adaptor._editing_pos,
     )
     adaptor.start_ipc()
     adaptor.run_persistent()
@@ -0,0 +1,97 @@
+from tkinter import Entry, Frame
+from tkinter.ttk import Scrollbar, Treeview
+
+from ..tag.table_tag import Cell, CellEdits, TableTag
+
+
+class TableEntryWrapper:
+    """A Treeview grid of a TableTag with in-place cell editing.
+
+    Double-click edits a cell, Enter edits the first cell of the focused row.
+    In the cell editor, Enter confirms, Tab confirms and moves to the next cell, Escape reverts.
+
+    Used as the tkinter_form variable of the field: `get` returns the edited cells only.
+    """
+
+    def __init__(self, master, tag: TableTag):
+        self.tag = tag
+        self.rows: list[list[Cell]] = tag._get_ui_val()
+        self.cells: dict[tuple[int, int], Cell] = {}
+        """ The edited cells """
+        self._editor: Entry | None = None
+        self._editing: tuple[int, int] = 0, 0
+        """ The cell under the editor """
+
+        self.frame = Frame(master)
+        height = max(1, min(len(self.rows), 10))
+        self.tree = tree = Treeview(
+            self.frame, columns=tag.columns, show="headings", height=height, selectmode="browse"
+        )
+        for col in tag.columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=100, stretch=True)
+        for i, row in enumerate(self.rows):
+            tree.insert("", "end", iid=str(i), values=row)
+        scrollbar = Scrollbar(self.frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        tree.bind("<Double-1>", self._on_double_click)
+        tree.bind("<Return>", self._on_return)  # "break" prevents the form submit
+        tag._last_ui_val = self.get()
+
+    def _on_double_click(self, event):
+        row, column = self.tree.identify_row(event.y), self.tree.identify_column(event.x)
+        if row and column:
+            self.edit(int(row), int(column[1:]) - 1)
+        return "break"
+
+    def _on_return(self, event=None):
+        if row := self.tree.focus():
+            self.edit(int(row), 0)
+        return "break"
+
+    def edit(self, row: int, col: int):
+        """Open the editor over the cell."""
+        self._commit()
+        self.tree.see(str(row))
+        self.tree.update_idletasks()
+        x, y, width, height = self.tree.bbox(str(row), f"#{col + 1}") or (0, 0, 100, 20)
+        self._editor = e = Entry(self.tree)
+        self._editing = row, col
+        e.insert(0, str(self.cells.get((row, col), self.rows[row][col])))
+        e.select_range(0, "end")
+        e.place(x=x, y=y, width=width, height=height)
+        e.focus_set()
+        e.bind("<Return>", lambda _: self._commit() or self.tree.focus_set() or "break")
+        e.bind("<Tab>", lambda _: self._commit() or self._next(row, col) or "break")
+        e.bind("<Escape>", lambda _: self._close() or self.tree.focus_set() or "break")
+        e.bind("<FocusOut>", lambda _: self._commit())
+
+    def _next(self, row: int, col: int):
+        if col + 1 < len(self.tag.columns):
+            self.edit(row, col + 1)
+        elif row + 1 < len(self.rows):
+            self.edit(row + 1, 0)
+        else:
+            self.tree.focus_set()
+
+    def _commit(self):
+        """Store the editor value to its cell and close the editor."""
+        if self._editor is None:
+            return
+        (row, col), value = self._editing, self._editor.get()
+        self._close()
+        if (row, col) in self.cells or value != str(self.rows[row][col]):
+            self.cells[(row, col)] = value
+            self.tree.set(str(row), self.tag.columns[col], value)
+            self.tag._on_change_trigger(self.get())
+
+    def _close(self):
+        e, self._editor = self._editor, None
+        if e is not None:
+            e.destroy()  # its FocusOut finds no editor
+
+    def get(self) -> CellEdits:
+        return CellEdits(dict(self.cells))
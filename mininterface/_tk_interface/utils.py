@@ -13,6 +13,7 @@ from ..tag.datetime_tag import DatetimeTag
 from ..tag.path_tag import PathTag
 
 from ..tag.select_tag import SelectTag
+from ..tag.table_tag import TableTag
 
 from ..tag.internal import CallbackButtonWidget, FacetButtonWidget, SubmitButtonWidget
 
@@ -25,6 +26,7 @@ from ..tag.secret_tag import SecretTag
 from .select_input import SelectInputWrapper, VariableAnyWrapper
 from .date_entry import DateEntryFrame
 from .secret_entry import SecretEntryWrapper
+from .table_entry import TableEntryWrapper
 
 from .external_fix import __create_widgets_monkeypatched
 
@@ -237,6 +239,13 @@ def replace_widgets(adaptor: "TkAdaptor", nested_widgets, form: TagDict):
                 # Create wrapper and store it in the widget list
                 wrapper = SecretEntryWrapper(master, tag, variable, grid_info, adaptor)
                 widget = wrapper.entry
+            case TableTag():
+                # The wrapper is the variable, it returns the edited cells.
+                wrapper = TableEntryWrapper(master, tag)
+                grid_info = replace_variable(wrapper)
+                wrapper.frame.grid(row=grid_info["row"], column=grid_info["column"], sticky="we")
+                widget = taking_focus = wrapper.tree
+                process_change_handler = False  # the wrapper triggers on_change itself
             case _:
                 match tag._recommend_widget():
                     # Special type: Submit button
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from time import monotonic
 from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 from warnings import warn
 
 from .._lib.redirectable import Redirectable
 from .._lib.form_types import EnvClass
+from ..tag.tag import Tag, TagValue
 
 if TYPE_CHECKING:
     from .._mininterface.adaptor import BackendAdaptor
@@ -26,6 +28,61 @@ LayoutElement = TypeVar("LayoutElement", str, Image, Path, "Self")
 """ Either a string, Path or facet.Image. """
 
 
+class Progress:
+    """A progress handle, see [`Facet.progress`][mininterface.facet.Facet.progress].
+
+    Calling `advance` or `set` is cheap, the UI is redrawn at most
+    [`UiSettings.progress_rate`][mininterface.settings.UiSettings.progress_rate] times a second,
+    always with the latest value.
+    """
+
+    def __init__(self, facet: "Facet", total: Optional[float], description: str, rate: float):
+        self.total = total
+        """ The value of the complete work. None if unknown. """
+        self.description = description
+        self.n: float = 0
+        """ The current value. """
+        self.closed = False
+        self._facet = facet
+        self._interval = 1 / rate if rate else 0
+        self._shown_at = float("-inf")
+
+    def advance(self, n: float = 1) -> None:
+        """Add to the current value."""
+        self.n += n
+        if (now := monotonic()) - self._shown_at >= self._interval:
+            self._shown_at = now
+            self._facet._show_progress(self)
+
+    def set(self, n: float) -> None:
+        """Set the current value."""
+        self.n = n
+        if (now := monotonic()) - self._shown_at >= self._interval:
+            self._shown_at = now
+            self._facet._show_progress(self)
+
+    def close(self) -> None:
+        """Show the final value and remove the progress bar."""
+        if not self.closed:
+            self.closed = True
+            self._facet._show_progress(self)
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __str__(self):
+        """A text progress bar, ex. `Copying [#####     ] 50 % 5/10`."""
+        prefix = f"{self.description} " if self.description else ""
+        if not self.total:
+            return f"{prefix}{self.n:g}"
+        ratio = min(max(self.n / self.total, 0), 1)
+        done = round(ratio * 20)
+        return f"{prefix}[{'#' * done}{' ' * (20 - done)}] {ratio:.0%} {self.n:g}/{self.total:g}"
+
+
 class Facet(Generic[EnvClass]):
     """A frontend side of the interface. While a dialog is open,
         this allows to set frontend properties like the heading.
@@ -65,6 +122,63 @@ class Facet(Generic[EnvClass]):
         # NOTE remove warn when working in textual
         warn("Facet layout not implemented for this interface.")
 
+    def progress(self, total: Optional[float] = None, description: str = "") -> Progress:
+        """Show a progress bar while a long work runs. Returns a handle to move it.
+
+        ```python
+        from mininterface import run
+
+        with run() as m:
+            with m.facet.progress(total=len(files), description="Copying") as progress:
+                for file in files:
+                    copy(file)
+                    progress.advance()
+        ```
+
+        Args:
+            total: The value of the complete work. If None, only the current value is shown.
+            description: A text shown along the bar.
+        """
+        return Progress(self, total, description, self.adaptor.settings.progress_rate)
+
+    def _show_progress(self, progress: Progress):
+        """Redraw the progress bar. Called by the Progress handle, throttled."""
+        pass
+
+    def update_values(self, values: "dict[str | Tag, TagValue]") -> None:
+        """Set the values of the current form, even from another thread, while the dialog is open.
+        Like [`Tag.push`][mininterface.Tag.push] for multiple fields at once.
+
+        ```python
+        m.facet.update_values({"status": "Downloading", "received": 1024})
+        ```
+
+        Args:
+            values: {the form key or the tag: the new value}
+                Keys of the nested sections are searched too.
+        """
+        tags = {}
+        for key, val in values.items():
+            tag = key if isinstance(key, Tag) else self._find_tag(key)
+            tag._set_val(val)
+            tags[id(tag)] = tag
+        self._push(list(tags.values()))
+
+    def _find_tag(self, key: str) -> Tag:
+        """The tag of the current form under the key."""
+        stack = [self._form or {}]
+        while stack:
+            form = stack.pop()
+            if isinstance(tag := form.get(key), Tag):
+                return tag
+            stack.extend(v for v in form.values() if isinstance(v, dict))
+        raise KeyError(key)
+
+    def _push(self, tags: list[Tag]):
+        """Show the new values of the tags in the open dialog. Called from any thread.
+        The UIs that read the tag values when building the next dialog need not to do anything."""
+        pass
+
     def submit(self, _post_submit=None):
         """Submits the whole form.
 
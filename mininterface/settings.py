@@ -143,6 +143,29 @@ class UiSettings:
     mnemonic_hidden: bool = False
     """ If True, the field label is not underlined to mark the mnemonic. """
 
+    live_callback_delay: Optional[float] = None
+    """ Seconds to wait after the last change of a field before its `on_change` and `validation` run.
+
+    Applies to the interfaces that run the UI in a subprocess (gui, tui), where these callbacks
+    are run by your program while the UI waits for them.
+
+    * `None`: The UI waits for each callback to finish (a slow callback makes typing lag).
+    * `float`: The UI stays responsive. Rapid changes of the same field are coalesced,
+        only the latest value is sent after the given delay and results the field has already
+        outdated are dropped.
+    """
+
+    progress_rate: float = 10
+    """ How many times a second at most a [`facet.progress`][mininterface.facet.Facet.progress] bar is redrawn.
+    (The updates in between are not sent to the UI, the next redraw shows the latest value.)
+    0 redraws on every update. """
+
+    push_rate: float = 10
+    """ How many times a second at most the values set by [`Tag.push`][mininterface.Tag.push]
+    are sent to an open dialog. The values pushed to the same field in between are coalesced,
+    the latest is shown. 0 sends every push at once.
+    Applies to the interfaces that run the UI in a subprocess (gui, tui). """
+
 
 @_dataclass
 class GuiSettings(UiSettings):
@@ -171,7 +194,15 @@ class TuiSettings(UiSettings): ...
 
 
 @_dataclass
-class TextualSettings(TuiSettings): ...
+class TextualSettings(TuiSettings):
+    lazy_sections_since: Optional[int] = None
+    """ The number of fields since which the form sections render lazily.
+
+    Each nested section (a sub-dataclass, a nested dict) is shown as a collapsed group whose
+    widgets are built only when the user expands it, so that a large form opens at once.
+    The values of the fields never shown are submitted as they are.
+    If `None`, all the fields are rendered at once.
+    """
 
 
 @_dataclass
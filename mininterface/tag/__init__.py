@@ -4,5 +4,6 @@ from .datetime_tag import DatetimeTag
 from .path_tag import PathTag
 from .secret_tag import SecretTag
 from .select_tag import SelectTag
+from .table_tag import TableTag
 
-__all__ = ["Tag", "CallbackTag", "DatetimeTag", "PathTag", "SecretTag", "SelectTag"]
+__all__ = ["Tag", "CallbackTag", "DatetimeTag", "PathTag", "SecretTag", "SelectTag", "TableTag"]
@@ -0,0 +1,176 @@
+from ast import literal_eval
+from dataclasses import dataclass, fields, is_dataclass, replace
+from typing import Any, Callable, Optional, get_args, get_origin, get_type_hints
+
+from .tag import Tag, TagValue, ValidationResult
+
+Record = Any
+""" A dataclass instance or a dict. """
+Cell = str | int | float | bool
+""" A cell as shown in the UI. """
+
+
+class CellEdits:
+    """The cells the user has changed, as the UI value of a TableTag.
+
+    Sparse: only the edited cells travel, not the whole table.
+    (Not a dict so that it is not mistaken for a form section.)
+    """
+
+    __slots__ = ("cells",)
+
+    def __init__(self, cells: Optional[dict[tuple[int, int], Cell]] = None):
+        self.cells = cells if cells is not None else {}
+        """ {(row, column index): the new UI value} """
+
+    def __eq__(self, other):
+        return isinstance(other, CellEdits) and self.cells == other.cells
+
+    def __repr__(self):
+        return f"CellEdits({self.cells!r})"
+
+
+@dataclass(repr=False)
+class TableTag(Tag[TagValue]):
+    """
+    Edit a list of records – dataclass instances or dicts – in a grid.
+    A record is a row, its fields are the columns.
+
+    ```python
+    from dataclasses import dataclass
+    from mininterface import run
+    from mininterface.tag import TableTag
+
+    @dataclass
+    class Item:
+        name: str
+        count: int
+
+    m = run()
+    out = m.form({"Stock": TableTag([Item("apple", 2), Item("pear", 5)])})
+    print(out)
+    # {'Stock': [Item(name='apple', count=2), Item(name='pear', count=5)]}
+    ```
+
+    A `list[dataclass]` field becomes a TableTag automatically.
+
+    The cells are converted to the type of their column and validated one by one,
+    then the changed rows by the `row_validation`. Only the edited cells are sent back from the UI.
+    """
+
+    columns: Optional[list[str]] = None
+    """ The record fields shown as the columns.
+        By default, all the fields of the dataclass or the keys of the first dict. """
+
+    row_validation: Optional[Callable[[Record], ValidationResult]] = None
+    """ Check a changed row. Receives the new record, returns True or an error message.
+
+    ```python
+    TableTag(items, row_validation=lambda item: item.count >= 0 or "Negative count")
+    ```
+    """
+
+    page_size: int = 20
+    """ Rows per page in the text interface. """
+
+    # Set in __post_init__. (A UI subprocess child rebuilds the tag without running it.)
+    _record_type = None
+    """ The dataclass of the records. None for dicts. """
+    _column_types = {}
+    """ {column: annotation}. None to guess the type from the value. """
+
+    def __post_init__(self):
+        super().__post_init__()
+        args = get_args(self.annotation) if get_origin(self.annotation) is list else ()
+        if args and is_dataclass(args[0]):
+            self._record_type = args[0]
+        elif self.val and is_dataclass(self.val[0]):
+            self._record_type = type(self.val[0])
+
+        if self._record_type:
+            hints = get_type_hints(self._record_type)
+            self._column_types = {f.name: hints.get(f.name) for f in fields(self._record_type)}
+        elif self.val and isinstance(self.val[0], dict):
+            self._column_types = {key: None for key in self.val[0]}  # the Tag guesses it from the value
+        if self.columns is None:
+            self.columns = list(self._column_types)
+
+    def __hash__(self):  # every Tag child must have its own hash method to be used in Annotated
+        return super().__hash__()
+
+    def _get_ui_val(self) -> list[list[Cell]]:
+        """The rows as lists of cells."""
+        return [self._cells(record) for record in self.val or ()]
+
+    def _cells(self, record: Record) -> list[Cell]:
+        return [self._ui_cell(self._get_field(record, col)) for col in self.columns]
+
+    @staticmethod
+    def _ui_cell(v) -> Cell:
+        if v is None:
+            return ""
+        if isinstance(v, (str, int, float, bool)):
+            return v
+        return str(v)
+
+    def _get_field(self, record: Record, col: str):
+        if isinstance(record, dict):
+            return record.get(col)
+        if isinstance(record, list):  # a row of cells, as a UI subprocess child receives it (see _lib.wire)
+            return record[self.columns.index(col)]
+        return getattr(record, col)
+
+    def _diff(self, rows: list[list[Cell] | Record]) -> CellEdits:
+        """The cells that differ from the current value. The rows might be given as records too."""
+        edits = CellEdits()
+        for r, (row, current) in enumerate(zip(rows, self._get_ui_val())):
+            if not isinstance(row, list):
+                row = self._cells(row)
+            edits.cells.update(((r, c), cell) for c, (cell, cur) in enumerate(zip(row, current)) if cell != cur)
+        return edits
+
+    def _convert_cell(self, row: int, col: str, ui_value: Cell):
+        """The UI value converted to the column type and checked. Raises ValueError."""
+        cell = Tag(self._get_field(self.val[row], col), annotation=self._column_types.get(col))
+        if not cell.update(ui_value):
+            raise ValueError(f"Row {row + 1}, {col}: {cell._error_text}")
+        return cell.val
+
+    def _apply(self, edits: CellEdits) -> list[Record]:
+        """A new list of records with the edits applied. The unchanged records are kept. Raises ValueError."""
+        changes: dict[int, dict[str, Any]] = {}
+        for (row, c), ui_value in sorted(edits.cells.items()):
+            col = self.columns[c]
+            changes.setdefault(row, {})[col] = self._convert_cell(row, col, ui_value)
+
+        records = list(self.val)
+        for row, change in changes.items():
+            record = records[row]
+            if isinstance(record, dict):
+                new = {**record, **change}
+            elif isinstance(record, list):
+                new = [change.get(col, v) for col, v in zip(self.columns, record)]
+            else:
+                new = replace(record, **change)
+            if self.row_validation and (res := self.row_validation(new)) is not True:
+                raise ValueError(f"Row {row + 1}: {res or 'Validation fail'}")
+            records[row] = new
+        return records
+
+    def update(self, ui_value: CellEdits | list[list[Cell]] | str) -> bool:
+        """Apply the edited cells. The UI may send either CellEdits, or the whole table (which is diffed)."""
+        self.remove_error_text()
+        try:
+            if isinstance(ui_value, str):
+                try:
+                    ui_value = literal_eval(ui_value)
+                except (SyntaxError, ValueError):
+                    raise ValueError("Not a valid table")
+            edits = ui_value if isinstance(ui_value, CellEdits) else self._diff(ui_value)
+            out_value = self._apply(edits) if edits.cells else self.val
+            self.val = self._validate(out_value)
+        except ValueError as e:
+            self.set_error_text(str(e))
+            return False
+        self._update_source(out_value)
+        return True
@@ -861,6 +861,34 @@ class Tag(Generic[TagValue]):
         self._update_source(val)
         return self
 
+    def push(self, val: TagValue) -> None:
+        """Set the value from your program, even from another thread, while the dialog is open.
+        The open dialog shows the new value, unless the user is just editing the field.
+
+        ```python
+        from threading import Thread
+        from time import sleep
+        from mininterface import run, Tag
+
+        counter = Tag(0, label="Processed")
+
+        def work():
+            for i in range(100):
+                sleep(1)
+                counter.push(i)
+
+        m = run()
+        Thread(target=work, daemon=True).start()
+        m.form({"Processed": counter, "Note": ""})
+        ```
+
+        Unlike [`update`][mininterface.Tag.update], the value is not converted nor validated.
+        Use [`facet.update_values`][mininterface.facet.Facet.update_values] to push multiple values at once.
+        """
+        self._set_val(val)
+        if self._facet is not None:
+            self._facet._push([self])
+
     def update(self, ui_value: UiValue | str) -> bool:
         """Update the tag value with type conversion and checks.
 
@@ -1,4 +1,5 @@
 from copy import copy
+from dataclasses import is_dataclass
 from datetime import date, time
 from enum import Enum
 from pathlib import Path
@@ -9,6 +10,7 @@ from annotated_types import BaseMetadata, GroupedMetadata, Len
 from . import DatetimeTag, SelectTag, Tag
 from .callback_tag import CallbackTag
 from .path_tag import PathTag
+from .table_tag import TableTag
 from .tag import TagValue, ValidationCallback
 from .type_stubs import TagCallback
 
@@ -41,6 +43,9 @@ def _get_tag_type(tag: Tag) -> Type[Tag]:
         return DatetimeTag
     if tag._is_subclass(Enum):
         return SelectTag
+    if len(pt) == 1 and pt[0][0] is list and is_dataclass(pt[0][1]):
+        # `list[Item]` where Item is a dataclass
+        return TableTag
     return type(tag)
 
 
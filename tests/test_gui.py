@@ -161,6 +161,31 @@ class TestGuiWidgets(unittest.TestCase):
         self._render({"y": Tag(2)})
         self.assertEqual(1, len(self._of_class("TEntry")))
 
+    def test_same_structure_reuses_widgets(self):
+        """A form shaped like the previous one is shown in the kept widgets with its values."""
+        from mininterface._lib.wire import decode_form, fingerprint
+        ad = self.adaptor
+        ad._clear_dialog()
+
+        def show(raw_form):
+            wire = SubprocessAdaptorBase._wire_form(raw_form)
+            ad._show_form(decode_form(wire), "T", True, [], "", False, None, fingerprint(wire))
+            ad.update_idletasks()
+            return ad.form
+
+        try:
+            first = show({"name": Tag("Alice"), "n": Tag(1)})
+            entries = self._of_class("TEntry")
+            ad._ok()
+            self.assertIs(first, show({"name": Tag("Bob"), "n": Tag(2)}))
+            self.assertEqual(entries, self._of_class("TEntry"))
+            self.assertEqual({"name": "Bob", "n": 2}, ad.form.get())
+            ad._ok()
+            self.assertIsNot(first, show({"name": Tag("Bob", label="Renamed"), "n": Tag(2)}))
+        finally:
+            ad._kept_form = None
+            ad._clear_dialog()
+
 
 @unittest.skipUnless(_has_display(), "No display available (run under xvfb-run -a)")
 class TestGuiSubprocess(unittest.TestCase):
@@ -62,6 +62,66 @@ class TestInterface(TestAbstract):
         with self.assertOutputs("Alert text"):
             m.alert("")
 
+    @mock_interactive_terminal
+    def test_async_api(self):
+        """The a-methods run the blocking ones off the event loop."""
+        import asyncio
+
+        async def main(m):
+            return (await m.aform({"number": 1}), await m.aask("Test input", int),
+                    await m.aconfirm("Sure?", False), await m.aselect({"label": 1}))
+
+        self.assertEqual(({"number": 1}, 0, False, 1), asyncio.run(main(run(interface=Mininterface))))
+
+        async def text(m):
+            return await m.aask("Number", int), await m.aconfirm("")
+
+        with patch("builtins.input", side_effect=["5", "y"]):
+            self.assertEqual((5, True), asyncio.run(text(run(interface=TextInterface))))
+
+    def test_submit(self):
+        m = run(interface=Mininterface)
+        self.assertEqual([True, False, 1], [f.result(1) for f in (
+            m.submit(m.confirm, "Sure?"), m.submit(m.confirm, "Sure?", False, priority=1), m.submit(m.select, [1]))])
+
+    @mock_interactive_terminal
+    def test_progress(self):
+        m = run(interface=TextInterface, settings=TextSettings(progress_rate=0))
+        half, full = "Copying [##########          ] 50% 1/2", "Copying [####################] 100% 2/2"
+        with self.assertOutputs(f"{half}\r{full}\r{full}"):  # a single redrawn line
+            with m.facet.progress(total=2, description="Copying") as progress:
+                progress.advance()
+                progress.set(2)
+        progress = m.facet.progress()
+        progress.advance(3)
+        self.assertEqual("3", str(progress))
+
+    def test_template(self):
+        m = run(interface=Mininterface)
+        source = {"name": "", "nested": {"n": 1}}
+        review = m.template(source, "Review")
+        self.assertEqual({"name": "a", "nested": {"n": 1}}, review.show({"name": "a"}))
+        self.assertEqual({"name": "a", "nested": {"n": 2}}, review.show({"nested": {"n": 2}}))
+        self.assertEqual("a", source["name"])
+        with self.assertRaises(KeyError):
+            review.show({"missing": 1})
+
+        env = NestedDefaultedEnv(FurtherEnv1())
+        self.assertIs(env, m.template(env).show({"further": {"host": "example.com"}}))
+        self.assertEqual("example.com", env.further.host)
+        out = m.template(SimpleEnv).show({"test": True})
+        self.assertIsInstance(out, SimpleEnv)
+        self.assertTrue(out.test)
+
+        # A form shown again keeps its mnemonics.
+        from mininterface._mininterface.adaptor import BackendAdaptor
+        form = {"a": Tag(1), "b": Tag(2)}
+        with patch.object(BackendAdaptor, "_determine_mnemonic") as determine:
+            m._adaptor._setup_form_facet(form)
+            m._adaptor._setup_form_facet(form)
+            m._adaptor._setup_form_facet({"a": Tag(1), "b": Tag(2)})
+        self.assertEqual(2, determine.call_count)
+
     def test_ask_param(self):
         m0 = run(interface=Mininterface)
         self.assertEqual(datetime.now().date(), m0.ask("Test input", DatetimeTag(date=True)))
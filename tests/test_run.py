@@ -353,23 +353,23 @@ class TestRun(TestAbstract):
     def test_settings_run(self):
         m = runm()
         self.assertEqual(
-            """UiSettings(toggle_widget='f4', mnemonic=True, mnemonic_hidden=False)""", repr(m._adaptor.settings)
+            """UiSettings(toggle_widget='f4', mnemonic=True, mnemonic_hidden=False, live_callback_delay=None, progress_rate=10, push_rate=10)""", repr(m._adaptor.settings)
         )
 
         m = runm(config_file="tests/some-settings.yaml")
         self.assertEqual(
-            """UiSettings(toggle_widget='f4', mnemonic=True, mnemonic_hidden=True)""", repr(m._adaptor.settings)
+            """UiSettings(toggle_widget='f4', mnemonic=True, mnemonic_hidden=True, live_callback_delay=None, progress_rate=10, push_rate=10)""", repr(m._adaptor.settings)
         )
 
         # why the for cycle? It is no change whether we put whole MininterfaceSettings or its param
         for u in (MSOrig(ui=UiSettings(toggle_widget="f5")), UiSettings(toggle_widget="f5")):
             m = runm(settings=u, config_file=False)
             self.assertEqual(
-                """UiSettings(toggle_widget='f5', mnemonic=True, mnemonic_hidden=False)""", repr(m._adaptor.settings)
+                """UiSettings(toggle_widget='f5', mnemonic=True, mnemonic_hidden=False, live_callback_delay=None, progress_rate=10, push_rate=10)""", repr(m._adaptor.settings)
             )
             m = runm(settings=u, config_file="tests/some-settings.yaml")
             self.assertEqual(
-                """UiSettings(toggle_widget='f5', mnemonic=True, mnemonic_hidden=True)""", repr(m._adaptor.settings)
+                """UiSettings(toggle_widget='f5', mnemonic=True, mnemonic_hidden=True, live_callback_delay=None, progress_rate=10, push_rate=10)""", repr(m._adaptor.settings)
             )
 
     def test_add_version(self):
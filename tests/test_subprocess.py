@@ -11,14 +11,18 @@ Run with:
     python -m unittest tests/test_subprocess.py
 """
 import io
+import os
 import pickle
 import sys
+import time
 import unittest
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 
+from mininterface import Mininterface
 from mininterface.tag import Tag, SelectTag
+from mininterface._lib.form_dict import dict_to_tagdict
 from mininterface.validators import not_empty
 from mininterface._lib.auxiliary import flatten
 from mininterface._lib.subprocess_base import SubprocessAdaptorBase, _stripped_callback
@@ -210,6 +214,115 @@ class TestSafeForm(unittest.TestCase):
         m = run(AttrEnv, interface="text", args=[])
         _child_safe(dataclass_to_tagdict(m.env, m))  # raises on a leak
 
+    def test_rebuild_verdict_memoised_per_type(self):
+        """Plain values are probed once per type; builtins, classes and typing
+        constructs are decided without pickling at all."""
+        from unittest.mock import patch
+        import mininterface._lib.subprocess_base as sb
+        sb._REBUILD_BY_TYPE.pop(Point, None)
+        with patch.object(sb, "_probe_rebuild", wraps=sb._probe_rebuild) as probe:
+            self.assertTrue(all(sb._child_can_rebuild(Point(i)) for i in range(50)))
+            self.assertEqual(1, probe.call_count)
+            for obj in (1, "a", [Path("/tmp"), None], {"a": (1, 2.0)}, Point, list[Path] | None):
+                self.assertTrue(sb._child_can_rebuild(obj), obj)
+            self.assertEqual(1, probe.call_count)
+            with _as_main(Point):
+                self.assertFalse(sb._child_can_rebuild(Point(1)))
+                self.assertFalse(sb._child_can_rebuild(list[Point]))
+            self.assertFalse(sb._child_can_rebuild([1, lambda: 1]))
+
+    def test_original_tags_untouched(self):
+        """The tags sent are copies; the parent tags keep their values and callbacks."""
+        tag = Tag(val=Point(1), annotation=Point, validation=a_validator)
+        with _as_main(Point):
+            _child_safe({"p": tag})
+        self.assertIsInstance(tag.val, Point)
+        self.assertIs(tag.annotation, Point)
+        self.assertIs(tag.validation, a_validator)
+
+
+def _child_wire(form):
+    """Encode the form for the FORM message, cross the pipe as the child would
+    and decode it back to the TagDict the child renders."""
+    from mininterface._lib.wire import decode_form
+    blob = pickle.dumps(SubprocessAdaptorBase._wire_form(form))
+    return decode_form(_ChildUnpickler(io.BytesIO(blob)).load())
+
+
+class TestWireForm(unittest.TestCase):
+    """Tags made of stdlib types travel as compact TagWire records."""
+
+    def test_plain_tags_travel_as_records(self):
+        from mininterface._lib.wire import TagWire
+        from mininterface.tag import PathTag
+        form = {"": {"n": Tag(1), "p": PathTag(Path("/tmp"), is_dir=True)}, "sub": {"s": Tag("x")}}
+        wire = SubprocessAdaptorBase._wire_form(form)
+        self.assertTrue(all(isinstance(w, TagWire) for w in flatten(wire)))
+
+        n, p, s = flatten(_child_wire(form))
+        self.assertEqual((1, int), (n.val, n.annotation))
+        self.assertIsInstance(p, PathTag)
+        self.assertEqual((Path("/tmp"), True), (p.val, p.is_dir))
+        self.assertEqual("x", s.val)
+
+    def test_callbacks_become_proxies_at_their_position(self):
+        from mininterface._lib.subprocess_child_base import _OnChangeProxy, _ValidationProxy
+        with _as_main(a_callback, a_validator):
+            form = {"btn": Tag(val=a_callback), "f": Tag("", validation=a_validator, on_change=a_validator)}
+            btn, f = flatten(_child_wire(form))
+        self.assertIs(btn.val, _stripped_callback)
+        self.assertTrue(btn._is_a_callable())
+        self.assertIsInstance(f.validation, _ValidationProxy)
+        self.assertIsInstance(f.on_change, _OnChangeProxy)
+        self.assertEqual(1, f.validation.tag_pos)
+
+    def test_select_travels_as_labels(self):
+        with _as_main(Action):
+            form = {"a": SelectTag(val=Action.NOTIFY, options=Action, tips=[Action.SHUTDOWN]),
+                    "m": SelectTag(val=[Action.SHUTDOWN], options=Action)}
+            a, m = flatten(_child_wire(form))
+        self.assertEqual({"notify-send": "notify-send", "shutdown": "shutdown"}, a.options)
+        self.assertEqual("notify-send", a.val)
+        self.assertEqual(["shutdown"], a.tips)
+        self.assertEqual(["shutdown"], m.val)
+        self.assertTrue(m.multiple)
+
+    def test_error_text_is_kept(self):
+        tag = Tag("", description="desc", label="name", validation=not_empty)
+        tag.update("")
+        child = list(flatten(_child_wire({"f": tag})))[0]
+        self.assertEqual(tag._error_text, child._error_text)
+        self.assertEqual((tag.label, tag.description), (child.label, child.description))
+        child.remove_error_text()
+        self.assertEqual(("name", "desc"), (child.label, child.description))
+
+    def test_fingerprint_tells_structure_from_values(self):
+        from mininterface._lib.wire import fingerprint
+
+        def fp(form):
+            return fingerprint(SubprocessAdaptorBase._wire_form(form))
+
+        base = fp({"s": {"a": Tag("x"), "b": Tag(1)}, "c": SelectTag("b", options=["a", "b"])})
+        self.assertIsNotNone(base)
+        self.assertEqual(base, fp({"s": {"a": Tag("y"), "b": Tag(2)}, "c": SelectTag("a", options=["a", "b"])}))
+        self.assertNotEqual(base, fp({"s": {"a": Tag("y", label="A"), "b": Tag(2)}, "c": SelectTag("a", options=["a", "b"])}))
+        self.assertNotEqual(base, fp({"s": {"a": Tag("y"), "b": Tag(2)}, "c": SelectTag("a", options=["a", "c"])}))
+        self.assertNotEqual(base, fp({"s": {"a": Tag("y")}, "b": Tag(2), "c": SelectTag("a", options=["a", "b"])}))
+        failed = Tag("", validation=not_empty)
+        failed.update("")
+        self.assertNotEqual(fp({"f": Tag("")}), fp({"f": failed}))
+        with _as_main(Point):
+            self.assertIsNone(fp({"p": Tag(val=Point(10), annotation=Point)}))
+
+    def test_custom_class_value_falls_back_to_pickle_path(self):
+        with _as_main(Point):
+            form = {"p": Tag(val=Point(10), annotation=Point)}
+            wire = SubprocessAdaptorBase._wire_form(form)
+            child = list(flatten(_child_wire(form)))[0]
+        self.assertIsInstance(list(flatten(wire))[0], Tag)
+        self.assertEqual("10", child.val)
+        self.assertIsNone(child.annotation)
+
 
 class TestButtonSubmitValidation(unittest.TestCase):
     """A callback button is a submit and must respect field validation."""
@@ -446,6 +559,207 @@ class TestProxySubmitSuppression(unittest.TestCase):
         self.assertEqual(["shutdown"], called)   # shutdown hook fired
 
 
+class TestLiveCallbacks(unittest.TestCase):
+    """UiSettings.live_callback_delay: the proxies do not block the UI thread; the
+    requests are debounced per tag and the outdated replies are dropped."""
+
+    def setUp(self):
+        import os
+        import mininterface._lib.subprocess_child_base as scb
+        self.scb = scb
+        self.cmd_r, self.cmd_w = os.pipe()  # parent → child replies
+        self.res_r, self.res_w = os.pipe()  # child → parent requests
+        self.updates = []
+        self.output = []
+        scb.register_hooks(self.cmd_r, self.res_w,
+                           apply_form_update=lambda updates, title: self.updates.append(updates),
+                           append_output=self.output.append)
+        scb.set_live_callback_delay(0.02)
+        scb._live.open_dialog()
+        self.addCleanup(lambda: [os.close(fd) for fd in (self.cmd_r, self.cmd_w, self.res_r, self.res_w)
+                                 if _safe_open(fd)])
+        self.addCleanup(scb.register_hooks, -1, -1, lambda *a: None, lambda *a: None)
+        self.addCleanup(scb._live.close_dialog)
+        self.addCleanup(scb.set_live_callback_delay, None)
+
+    def _requests(self, n):
+        from mininterface._lib.subprocess_child_base import read_msg
+        return [read_msg(self.res_r) for _ in range(n)]
+
+    def test_changes_coalesced(self):
+        """The proxy returns at once; only the latest of rapid changes is sent."""
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import _OnChangeProxy, _ValidationProxy
+        tag = Tag(val="")
+        for val in ("a", "ab", "abc"):
+            tag.val = val
+            self.assertIsNone(_OnChangeProxy(3)(tag))
+            self.assertIs(True, _ValidationProxy(3)(tag))
+        requests = sorted(self._requests(2), key=lambda r: r[1])
+        self.assertEqual([(IpcCommand.CALLBACK, "on_change", 3, "abc"), (IpcCommand.CALLBACK, "validate", 3, "abc")],
+                         [r[:4] for r in requests])
+        self.assertNotEqual(requests[0][4], requests[1][4])  # sequence numbers
+
+    def test_stale_replies_dropped(self):
+        """A reply outdated by a newer request of the same tag is not applied."""
+        import time
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import _OnChangeProxy, _ValidationProxy
+        tag = Tag(val="old")
+        _ValidationProxy(0)(tag)
+        _OnChangeProxy(0)(tag)
+        first = {r[1]: r[4] for r in self._requests(2)}
+        tag.val = "new"
+        _ValidationProxy(0)(tag)
+        _OnChangeProxy(0)(tag)
+        second = {r[1]: r[4] for r in self._requests(2)}
+        time.sleep(0.05)
+
+        self.scb._live.dispatch(IpcCommand.VALIDATE_RESULT, ["stale error", first["validate"]])
+        self.assertIsNone(tag._error_text)
+        self.scb._live.dispatch(IpcCommand.VALIDATE_RESULT, ["current error", second["validate"]])
+        self.assertEqual("current error", tag._error_text)
+
+        # A stale FORM_UPDATE keeps what the user typed since, the other tags are updated.
+        self.scb._live.dispatch(IpcCommand.FORM_UPDATE, [[(0, "old"), (1, "x")], "", first["on_change"]])
+        self.scb._live.dispatch(IpcCommand.FORM_UPDATE, [[(0, "NEW")], "", second["on_change"]])
+        self.assertEqual([[(1, "x")], [(0, "NEW")]], self.updates)
+
+    def test_worker_reads_replies_while_waiting(self):
+        """wait_submitted reads the replies (and output) until the dialog ends;
+        after that, nothing more is sent."""
+        import threading
+        import time
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import _ValidationProxy, send_msg, wait_submitted
+        self.scb._live.close_dialog()  # wait_submitted opens the dialog itself
+        submitted = threading.Event()
+        tag = Tag(val="")
+        worker = threading.Thread(target=wait_submitted, args=(submitted,))
+        worker.start()
+        while not self.scb._live.open:
+            time.sleep(0.001)
+        _ValidationProxy(0)(tag)
+        seq = self._requests(1)[0][4]
+        send_msg(self.cmd_w, (IpcCommand.OUTPUT, "printed"))
+        send_msg(self.cmd_w, (IpcCommand.VALIDATE_RESULT, "Cannot be empty", seq))
+        while tag._error_text is None:
+            time.sleep(0.001)
+        submitted.set()
+        worker.join(1)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(["printed"], self.output)
+
+        _ValidationProxy(0)(tag)  # the dialog has ended
+        self.assertFalse(self.scb._live.timers)
+
+    def test_parent_echoes_sequence(self):
+        """The parent numbers its reply like the request was numbered."""
+        import os
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import read_msg
+        from mininterface._lib.redirectable import Redirectable
+        from mininterface._mininterface import Mininterface
+        from mininterface._textual_interface.subprocess_adaptor import TextualSubprocessAdaptor
+
+        class _CI(Redirectable, Mininterface):
+            _adaptor: TextualSubprocessAdaptor
+
+        adaptor = TextualSubprocessAdaptor(_CI(), None)
+        adaptor.facet._form = {"f": Tag(val="hello", validation=not_empty)}
+        r, adaptor._write_fd = os.pipe()
+        adaptor._handle_callback("validate", 0, "", 7)
+        adaptor._handle_callback("on_change", 0, "", 8)
+        os.close(adaptor._write_fd)
+        (cmd1, _, seq1), (cmd2, _, _, seq2) = read_msg(r), read_msg(r)
+        os.close(r)
+        self.assertEqual((IpcCommand.VALIDATE_RESULT, 7), (cmd1, seq1))
+        self.assertEqual((IpcCommand.FORM_UPDATE, 8), (cmd2, seq2))
+
+
+class TestPush(unittest.TestCase):
+    """Tag.push and facet.update_values show the values in the open dialog."""
+
+    def setUp(self):
+        import os
+        import mininterface._lib.subprocess_child_base as scb
+        self.scb = scb
+        self.cmd_r, self.cmd_w = os.pipe()  # parent → child
+        self.res_r, self.res_w = os.pipe()  # child → parent
+        self.updates = []
+        scb.register_hooks(self.cmd_r, self.res_w,
+                           apply_form_update=lambda updates, title: self.updates.append(updates),
+                           append_output=lambda text: None, editing=lambda: 0)
+        self.addCleanup(lambda: [os.close(fd) for fd in (self.cmd_r, self.cmd_w, self.res_r, self.res_w)
+                                 if _safe_open(fd)])
+        self.addCleanup(scb.register_hooks, -1, -1, lambda *a: None, lambda *a: None)
+
+    def _adaptor(self, form):
+        from mininterface._lib.redirectable import Redirectable
+        from mininterface._mininterface import Mininterface
+        from mininterface._textual_interface.subprocess_adaptor import TextualSubprocessAdaptor
+
+        class _CI(Redirectable, Mininterface):
+            _adaptor: TextualSubprocessAdaptor
+
+        adaptor = TextualSubprocessAdaptor(_CI(), None)
+        adaptor.facet._fetch_from_adaptor(form)
+        adaptor._write_fd = self.cmd_w
+        adaptor._form_open = True
+        return adaptor
+
+    def _flush(self, adaptor):
+        if timer := adaptor._push_timer:
+            timer.join(1)
+
+    def test_pushes_coalesced(self):
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import read_msg
+        count, status = Tag(0), Tag("idle")
+        adaptor = self._adaptor({"count": count, "section": {"status": status}})
+        count.push(1)
+        self._flush(adaptor)
+        self.assertEqual((IpcCommand.PUSH, [(0, 1)]), read_msg(self.cmd_r))
+
+        count.push(2)  # within the push_rate interval, sent together with the next ones
+        adaptor.facet.update_values({"count": 3, "status": "busy"})
+        self._flush(adaptor)
+        self.assertEqual((IpcCommand.PUSH, [(0, 3), (1, "busy")]), read_msg(self.cmd_r))
+        self.assertEqual("busy", status.val)
+
+        adaptor._form_open = False  # the next dialog reads the tag value
+        count.push(4)
+        self._flush(adaptor)
+        os.close(self.cmd_w)
+        self.assertIsNone(read_msg(self.cmd_r))
+        self.assertEqual(4, count.val)
+
+    def test_source_updated(self):
+        env = {"count": 0}
+        m = Mininterface()
+        tags = dict_to_tagdict(env, m)
+        m._adaptor._setup_form_facet(tags)
+        m.facet.update_values({"count": 5})
+        self.assertEqual({"count": 5}, env)
+        with self.assertRaises(KeyError):
+            m.facet.update_values({"unknown": 5})
+
+    def test_child_skips_the_edited_field(self):
+        """The worker reads the pushed values while the dialog is open, the focused field is kept."""
+        import threading
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import send_msg, wait_submitted
+        submitted = threading.Event()
+        worker = threading.Thread(target=wait_submitted, args=(submitted,))
+        worker.start()
+        send_msg(self.cmd_w, (IpcCommand.PUSH, [(0, "typed over"), (1, "shown")]))
+        while not self.updates:
+            time.sleep(0.001)
+        submitted.set()
+        worker.join(1)
+        self.assertEqual([[(1, "shown")]], self.updates)
+
+
 def _safe_open(fd):
     import os
     try:
@@ -684,6 +998,125 @@ class TestDialogReentrancy(_AdaptorHarness):
         adaptor._guard_reentrancy()  # must not raise
 
 
+class TestAsyncDialog(_AdaptorHarness):
+    """Mininterface.aform & co.: the event loop runs while the child shows the
+    dialog; the callbacks run on the loop."""
+
+    def test_loop_runs_while_dialog_open(self):
+        import asyncio
+        import os
+        import threading
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface._lib.subprocess_child_base import send_msg
+
+        adaptor = self._adaptor()
+        adaptor.interface._always_shown = True
+        self._wire_child_reply(adaptor)
+        res_r, res_w = os.pipe()
+        os.close(adaptor._read_fd)
+        adaptor._read_fd = res_r
+        self.addCleanup(lambda: [os.close(fd) for fd in (res_r, res_w) if _safe_open(fd)])
+
+        validated_in = []
+
+        def validator(tag):
+            validated_in.append(threading.current_thread())
+            return True
+
+        form = {"f": Tag(val="x", validation=validator)}
+
+        async def main():
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(1)
+                    await asyncio.sleep(0.005)
+
+            async def child():
+                await asyncio.sleep(0.05)
+                send_msg(res_w, (IpcCommand.CALLBACK, "validate", 0, "y"))
+                await asyncio.sleep(0.05)
+                send_msg(res_w, (IpcCommand.RESULT, ["z"]))
+
+            tasks = asyncio.create_task(ticker()), asyncio.create_task(child())
+            out = await adaptor._arun(adaptor.run_dialog, form)
+            tasks[0].cancel()
+            return out, len(ticks)
+
+        out, ticks = asyncio.run(main())
+        self.assertIs(form, out)
+        self.assertEqual("z", form["f"].val)
+        self.assertGreater(ticks, 5)
+        self.assertEqual([threading.main_thread()] * 2, validated_in)  # live + on submit
+        self.assertIsNone(adaptor._async_loop)
+
+    def test_blocking_call_inside_running_loop(self):
+        """The blocking API keeps working from within a coroutine."""
+        import asyncio
+        from mininterface._lib.ipc_command import IpcCommand
+
+        adaptor = self._adaptor()
+        self._wire_child_reply(adaptor, (IpcCommand.RESULT, True))
+
+        async def main():
+            return adaptor.buttons("Continue?", [("Yes", True)])
+
+        self.assertIs(True, asyncio.run(main()))
+
+
+class TestDialogScheduler(_AdaptorHarness):
+    """Many threads share one window: their dialogs are served one at a time."""
+
+    def test_priority_order(self):
+        import threading
+        import time
+        from mininterface._lib.dialog_scheduler import DialogScheduler
+
+        scheduler = DialogScheduler()
+        shown = []
+        with scheduler.turn():  # a dialog is open, the others queue
+            futures = [scheduler.submit(shown.append, name, priority=priority)
+                       for name, priority in (("low", 0), ("high", 5), ("low2", 0), ("mid", 1))]
+            while len(scheduler._queue) < 4:
+                time.sleep(0.001)
+            with scheduler.turn():  # re-entrant for the owner
+                pass
+        for f in futures:
+            f.result(1)
+        self.assertEqual(["high", "mid", "low", "low2"], shown)
+
+        f = scheduler.submit(lambda: 1 / 0)
+        self.assertRaises(ZeroDivisionError, f.result, 1)
+        self.assertIsNone(scheduler._owner)
+
+    def test_threads_share_the_pipe(self):
+        """Concurrent dialogs do not interleave their frames; each thread reads its own reply."""
+        from concurrent.futures import ThreadPoolExecutor
+        from mininterface._lib.ipc_command import IpcCommand
+
+        adaptor = self._adaptor()
+        adaptor.interface._always_shown = True
+        cmd_r = self._wire_child_reply(adaptor, *((IpcCommand.RESULT, True),) * 8)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda i: adaptor.buttons(f"Job {i}?", [("Yes", True)]), range(8)))
+        self.assertEqual([True] * 8, results)
+        frames = self._parent_frames(adaptor, cmd_r)
+        self.assertEqual(sorted(f"Job {i}?" for i in range(8)), sorted(f[1] for f in frames))
+
+    def test_live_callback_flag_per_thread(self):
+        """A live callback refuses nested dialogs in its own thread only."""
+        import threading
+        adaptor = self._adaptor()
+        adaptor._in_live_callback = True
+        other = []
+        t = threading.Thread(target=lambda: other.append(adaptor._in_live_callback))
+        t.start()
+        t.join()
+        self.assertEqual([False], other)
+        self.assertTrue(adaptor._in_live_callback)
+
+
 class TestButtonsRawLayout(_AdaptorHarness):
     """facet._layout set before confirm()/alert() ships with the BUTTONS message
     instead of silently disappearing."""
@@ -706,6 +1139,24 @@ class TestButtonsRawLayout(_AdaptorHarness):
         self.assertEqual(["AHoj", Path("/tmp")], raw_layout)
 
 
+class TestFormValues(_AdaptorHarness):
+    """A form shaped like the previous one travels as its values only."""
+
+    def test_same_shape_sends_values_only(self):
+        from mininterface._lib.ipc_command import IpcCommand
+
+        adaptor = self._adaptor()
+        adaptor.interface._always_shown = True  # keep the child between the dialogs
+        cmd_r = self._wire_child_reply(adaptor, *[(IpcCommand.RESULT, ["x", 1])] * 3)
+        adaptor.run_dialog({"s": Tag("a", label="s"), "n": Tag(1, label="n")})
+        adaptor.run_dialog({"s": Tag("b", label="s"), "n": Tag(2, label="n")})
+        adaptor.run_dialog({"s": Tag("b", label="other"), "n": Tag(2, label="n")})
+
+        frames = self._parent_frames(adaptor, cmd_r)
+        self.assertEqual([IpcCommand.FORM, IpcCommand.FORM_VALUES, IpcCommand.FORM], [f[0] for f in frames])
+        self.assertEqual(["b", 2], frames[1][1])
+
+
 class TestTerminalReleaseAfterDialog(_AdaptorHarness):
     """Outside a `with` block the Textual child owns the tty (alternate screen +
     stdin), so it must be torn down after each dialog or a following input()/
@@ -776,6 +1227,34 @@ class TestWorkerLoopDispatch(_AdaptorHarness):
                        handlers={'CLEAR_OUTPUT': lambda: cleared.append(True), 'on_eof': lambda: None})
         self.assertEqual([True], cleared)
 
+    def test_progress_reaches_the_handler(self):
+        from mininterface._lib.ipc_command import IpcCommand
+        got = []
+        self._run_loop((IpcCommand.PROGRESS, 1, 5, 10, "Copying", False),
+                       handlers={'PROGRESS': lambda *args: got.append(args), 'on_eof': lambda: None})
+        self.assertEqual([(1, 5, 10, "Copying", False)], got)
+
+    def test_progress_sent_throttled(self):
+        from mininterface._lib.ipc_command import IpcCommand
+        adaptor = self._adaptor()
+        cmd_r = self._wire_child_reply(adaptor)
+        with adaptor.facet.progress(total=3, description="Copying") as progress:
+            for _ in range(3):
+                progress.advance()
+        frames = self._parent_frames(adaptor, cmd_r)
+        # the first update is drawn, the next ones are too fast, the final state is always drawn
+        self.assertEqual([(IpcCommand.PROGRESS, id(progress), 1, 3, "Copying", False),
+                          (IpcCommand.PROGRESS, id(progress), 3, 3, "Copying", True)], frames)
+
+    def test_form_values_fill_the_last_form(self):
+        from mininterface._lib.ipc_command import IpcCommand
+        wire = SubprocessAdaptorBase._wire_form({"s": Tag("a"), "n": Tag(1)})
+        got = []
+        self._run_loop((IpcCommand.FORM, wire, "T"), (IpcCommand.FORM_VALUES, ["b", 2], "T2"),
+                       handlers={'FORM': lambda _fd, form, title: got.append(([t.val for t in flatten(form)], title)),
+                                 'on_eof': lambda: None})
+        self.assertEqual([(["a", 1], "T"), (["b", 2], "T2")], got)
+
     def test_parent_clear_output_resets_history_without_child(self):
         adaptor = self._adaptor()
         adaptor._record_output("old text\n")
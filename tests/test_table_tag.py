@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+
+from mininterface._lib.form_dict import dataclass_to_tagdict
+from mininterface._lib.subprocess_base import SubprocessAdaptorBase
+from mininterface._lib.wire import TagWire, decode_form
+from mininterface.tag import TableTag
+from mininterface.tag.table_tag import CellEdits
+from shared import TestAbstract
+
+
+@dataclass
+class Item:
+    name: str
+    count: int
+
+
+@dataclass
+class Stock:
+    items: list[Item] = field(default_factory=lambda: [Item("apple", 2), Item("pear", 5)])
+
+
+class TestTableTag(TestAbstract):
+
+    def test_columns_and_cells(self):
+        t = TableTag([Item("apple", 2), Item("pear", 5)])
+        self.assertEqual(["name", "count"], t.columns)
+        self.assertEqual([["apple", 2], ["pear", 5]], t._get_ui_val())
+
+        t = TableTag([{"a": 1, "b": None}], columns=["b"])
+        self.assertEqual([[""]], t._get_ui_val())
+
+    def test_list_of_dataclasses_becomes_table(self):
+        env = Stock()
+        tag = dataclass_to_tagdict(env)[""]["items"]
+        self.assertIsInstance(tag, TableTag)
+        self.assertTrue(tag.update(CellEdits({(1, 1): "7"})))
+        self.assertEqual([Item("apple", 2), Item("pear", 7)], env.items)
+
+    def test_cell_conversion_and_validation(self):
+        items = [Item("apple", 2), Item("pear", 5)]
+        t = TableTag(items)
+        self.assertFalse(t.update(CellEdits({(0, 0): "plum", (1, 1): "many"})))
+        self.assertEqual("Row 2, count: Type must be int!", t._error_text)
+        self.assertIs(items, t.val)  # nothing applied
+
+        self.assertTrue(t.update(CellEdits({(0, 0): "plum"})))
+        self.assertEqual([Item("plum", 2), Item("pear", 5)], t.val)
+        self.assertIs(items[1], t.val[1])  # an unchanged record is kept
+        self.assertEqual(Item("apple", 2), items[0])  # the original list is not mutated
+
+    def test_row_validation(self):
+        t = TableTag([{"name": "a", "count": 1}], row_validation=lambda r: r["count"] >= 0 or "Negative count")
+        self.assertFalse(t.update([["a", "-1"]]))
+        self.assertEqual("Row 1: Negative count", t._error_text)
+        self.assertTrue(t.update([["b", "3"]]))
+        self.assertEqual([{"name": "b", "count": 3}], t.val)
+
+    def test_whole_value(self):
+        """Submitting the value itself (as the text interface does) changes nothing."""
+        t = TableTag([Item("apple", 2)])
+        self.assertTrue(t.update(t.val))
+        self.assertEqual([Item("apple", 2)], t.val)
+
+    def test_travels_as_cells(self):
+        form = {"t": TableTag([Item("apple", 2)], row_validation=lambda r: True)}
+        wire = SubprocessAdaptorBase._wire_form(form)
+        self.assertIsInstance(wire["t"], TagWire)
+        child = decode_form(wire)["t"]
+        self.assertEqual([["apple", 2]], child._get_ui_val())
+        self.assertEqual(["name", "count"], child.columns)
+
+        # the child may update its copy, the cells are guessed from the values
+        self.assertTrue(child.update(CellEdits({(0, 1): "3"})))
+        self.assertEqual([["apple", 3]], child.val)
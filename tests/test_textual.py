@@ -7,6 +7,7 @@ Run with:
     python -m unittest tests/test_textual.py
 """
 import os
+import pickle
 import unittest
 
 from mininterface.tag import Tag, SelectTag
@@ -19,6 +20,7 @@ class TestTextual(unittest.IsolatedAsyncioTestCase):
         """Create app + open IPC pipe. Call inside run_test() context."""
         from mininterface._lib.redirectable import Redirectable
         from mininterface._lib.subprocess_base import SubprocessAdaptorBase
+        from mininterface._lib.wire import decode_form
         from mininterface._mininterface import Mininterface
         from mininterface._textual_interface import subprocess_child as sc
         from mininterface._textual_interface.adaptor import TextualAdaptor
@@ -33,9 +35,10 @@ class TestTextual(unittest.IsolatedAsyncioTestCase):
         _res_r, res_w = os.pipe()
         self.app = App(adaptor, cmd_r, res_w)
         if form is not None:
-            safe = SubprocessAdaptorBase._safe_form(form)
+            # What the child gets from a FORM message (see _lib.wire).
+            safe = decode_form(pickle.loads(pickle.dumps(SubprocessAdaptorBase._wire_form(form))))
             for k, t in safe.items():
-                if not t.label:
+                if isinstance(t, Tag) and not t.label:
                     t.label = k
             self._safe_form = safe
         return self.app
@@ -151,6 +154,74 @@ class TestTextual(unittest.IsolatedAsyncioTestCase):
             await pilot.pause(0.1)
             self.assertEqual(IpcCommand.RESULT, app._result[0])
 
+    async def test_lazy_sections(self):
+        """With lazy_sections_since, a section is widgetized on expansion only and
+        the values of a never expanded section are submitted from its tags."""
+        from textual.widgets import Collapsible, Input
+        from mininterface._lib.ipc_command import IpcCommand
+        form = {"x": Tag(7, label="x"),
+                "sec": {"a": Tag("A", label="a"), "b": Tag(2, label="b")},
+                "other": {"c": Tag("C", label="c")}}
+        app = await self._open(form)
+        app.adaptor.settings.lazy_sections_since = 1
+        async with app.run_test(size=(60, 30)) as pilot:
+            await pilot.pause(0.3)
+            app._setup_form(self._safe_form, "T", True, [])
+            await app._async_refresh()
+            await pilot.pause(0.2)
+            self.assertEqual(["7"], [i.value for i in app.query(Input)])
+            self.assertEqual(2, len(app.query(Collapsible)))
+
+            app.query(Collapsible).first().collapsed = False
+            await pilot.pause(0.2)
+            self.assertEqual(["7", "A", "2"], [i.value for i in app.query(Input)])
+
+            app.action_confirm()
+            self.assertEqual((IpcCommand.RESULT, ["7", "A", "2", "C"]), app._result)
+            app.exit()
+
+    async def test_table_edits_cells(self):
+        """A TableTag renders a grid; an edited cell is submitted as a sparse CellEdits."""
+        from textual.widgets import DataTable
+        from mininterface._lib.ipc_command import IpcCommand
+        from mininterface.tag import TableTag
+        from mininterface.tag.table_tag import CellEdits
+        form = {"rows": TableTag([{"name": "a", "n": 1}, {"name": "b", "n": 2}], label="rows")}
+        app = await self._open(form)
+        async with app.run_test(size=(60, 20)) as pilot:
+            await pilot.pause(0.3)
+            app._setup_form(self._safe_form, "T", True, [])
+            await app._async_refresh()
+            await pilot.pause(0.2)
+            table = app.query_one(DataTable)
+            self.assertEqual(2, table.row_count)
+            table.focus()
+            await pilot.press("down", "right", "enter")
+            await pilot.pause(0.1)
+            await pilot.press("backspace", "5", "enter")
+            await pilot.pause(0.1)
+            self.assertEqual("5", table.get_cell_at((1, 1)))
+
+            app.action_confirm()
+            self.assertEqual((IpcCommand.RESULT, [CellEdits({(1, 1): "5"})]), app._result)
+            app.exit()
+
+    async def test_progress_bar(self):
+        """A progress bar appears below the form, moves and disappears when closed."""
+        from textual.widgets import Label, ProgressBar
+        app = await self._open()
+        async with app.run_test(size=(60, 16)) as pilot:
+            await pilot.pause(0.3)
+            app._show_progress(1, 2, 4, "Copying", False)
+            await pilot.pause(0.1)
+            bar = app.query_one("#progress ProgressBar", ProgressBar)
+            self.assertEqual(50, bar.percentage * 100)
+            self.assertEqual("Copying", str(app.query_one("#progress Label", Label).render()))
+            app._show_progress(1, 4, 4, "Copying", True)
+            await pilot.pause(0.1)
+            self.assertEqual(0, len(app.query("#progress ProgressBar")))
+            app.exit()
+
     async def test_escape_sets_cancel(self):
         """Pressing Escape sets _result to (CANCEL,)."""
         from mininterface._lib.ipc_command import IpcCommand